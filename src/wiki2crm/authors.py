@@ -260,7 +260,7 @@ def process_authors(g: Graph, all_qids: List[str]) -> None:
     place_cache: Dict[str, URIRef] = {}  # kept for parity, though not used for memo here
     time_span_cache: Dict[URIRef, URIRef] = {}
 
-    for i in tqdm(range(0, len(all_qids), batch_size)):
+    for i in tqdm(range(0, len(all_qids), batch_size), mininterval=2.0, smoothing=0):
         batch = all_qids[i:i+batch_size]
         batch_data = get_wikidata_batch(batch)
         for qid in batch:
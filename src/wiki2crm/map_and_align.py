@@ -6,7 +6,6 @@ and adds new identifiers from DBpedia, GeoNames etc.
 
 from rdflib import Graph, Namespace, URIRef, BNode, Literal
 from rdflib.namespace import RDF, RDFS, OWL
-from rdflib.collection import Collection
 import sys
 import re
 import time
@@ -18,6 +17,19 @@ from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
 import argparse
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from itertools import combinations
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import oxrdflib  # registers the native ox-* serializers with rdflib
+except ImportError:
+    oxrdflib = None
 
 # Namespaces 
 SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
@@ -50,11 +62,495 @@ SCHEMA = Namespace("https://schema.org/")
 URW = Namespace("https://purl.archive.org/urwriters#")
 URB = Namespace("https://purl.archive.org/urbooks#")
 
+DBPEDIA_BASE = "https://dbpedia.org/"
+
+# Write buffer for the serialized output
+OUTPUT_BUFFER = 1 << 20
+
+# Prefixes bound on the output graph
+BINDINGS = (
+    ("sappho_prop", SAPPHO_PROP),
+    ("ecrm", ECRM),
+    ("crm", CRM),
+    ("frbroo", FRBROO),
+    ("efrbroo", EFRBROO),
+    ("lrmoo", LRMOO),
+    ("intro", INTRO),
+    ("skos", SKOS),
+    ("bibo", BIBO),
+    ("cito", CITO),
+    ("dc", DC),
+    ("doco", DOCO),
+    ("dracor", DRACOR),
+    ("fabio", FABIO),
+    ("foaf", FOAF),
+    ("golem", GOLEM),
+    ("intertext_ab", INTERTEXT_AB),
+    ("intertext_tx", INTERTEXT_TX),
+    ("intertext_af", INTERTEXT_AF),
+    ("intertext_mt", INTERTEXT_MT),
+    ("mimotext", MIMOTEXT),
+    ("postdata_core", POSTDATA_CORE),
+    ("postdata_analysis", POSTDATA_ANALYSIS),
+    ("schema", SCHEMA),
+    ("urw", URW),
+    ("urb", URB),
+)
+
+# Terms with hyphens in their local name (not reachable via attribute access)
+ECRM_P4 = ECRM["P4_has_time-span"]
+ECRM_E52 = ECRM["E52_Time-Span"]
+GOLEM_G0 = GOLEM["G0_Character-Stoff"]
+
+# Alignments added when the class is instantiated in the input graph
+CLASS_ALIGN = {
+    # ecrm:E21_Person
+    ECRM.E21_Person: [
+        (DRACOR.author, SKOS.broadMatch, ECRM.E21_Person),
+        (ECRM.E21_Person, SKOS.broadMatch, FOAF.Agent),
+        (MIMOTEXT.Q11, SKOS.broadMatch, ECRM.E21_Person), # author
+        (MIMOTEXT.Q10, SKOS.closeMatch, ECRM.E21_Person), # person
+        (POSTDATA_CORE.Person, SKOS.closeMatch, ECRM.E21_Person),
+        (URW.Agent, SKOS.narrowMatch, ECRM.E21_Person),
+        (URW.Person, SKOS.closeMatch, ECRM.E21_Person),
+    ],
+    # ecrm:E35_Title
+    ECRM.E35_Title: [
+        (DOCO.Title, SKOS.closeMatch, ECRM.E35_Title),
+    ],
+    # ecrm:E74_Group
+    ECRM.E74_Group: [
+        (ECRM.E74_Group, SKOS.broadMatch, FOAF.Agent),
+        (POSTDATA_CORE.Organisation, SKOS.broadMatch, ECRM.E74_Group),
+        (POSTDATA_CORE.Organization, SKOS.broadMatch, ECRM.E74_Group),
+        (URW.Organization, SKOS.broadMatch, ECRM.E74_Group),
+        (URW.Publisher, SKOS.broadMatch, ECRM.E74_Group),
+    ],
+    # ecrm:E52_Time-Span
+    ECRM_E52: [
+        (DC.PeriodOfTime, SKOS.closeMatch, ECRM_E52),
+    ],
+    # ecrm:E53_Place
+    ECRM.E53_Place: [
+        (DC.Location, SKOS.closeMatch, ECRM.E53_Place),
+        (MIMOTEXT.Q26, SKOS.closeMatch, ECRM.E53_Place), # spatial concept
+        (POSTDATA_CORE.Place, SKOS.closeMatch, ECRM.E53_Place),
+        (URW.Place, SKOS.closeMatch, ECRM.E53_Place),
+    ],
+    # ecrm:E55_Type
+    ECRM.E55_Type: [
+        (DRACOR.genre, SKOS.broadMatch, ECRM.E55_Type),
+        (INTERTEXT_TX.TextGenre, SKOS.broadMatch, ECRM.E55_Type),
+        (MIMOTEXT.Q33, SKOS.broadMatch, ECRM.E55_Type), # genre
+    ],
+    # ecrm:E73_Information_Object
+    ECRM.E73_Information_Object: [
+        (FABIO.DigitalItem, SKOS.broadMatch, ECRM.E73_Information_Object),
+    ],
+    # lrmoo:F1_Work
+    LRMOO.F1_Work: [
+        (FABIO.Work, SKOS.closeMatch, LRMOO.F1_Work),
+        (FABIO.LiteraryArtisticWork, SKOS.broadMatch, LRMOO.F1_Work),
+        (POSTDATA_CORE.PoeticWork, SKOS.broadMatch, LRMOO.F1_Work),
+        (URB.Work, SKOS.closeMatch, LRMOO.F1_Work),
+    ],
+    # lrmoo:F2_Expression
+    LRMOO.F2_Expression: [
+        (FOAF.Document, SKOS.broadMatch, LRMOO.F2_Expression),
+        (BIBO.Manuscript, SKOS.broadMatch, LRMOO.F2_Expression),
+        (DRACOR.play, SKOS.broadMatch, LRMOO.F2_Expression),
+        (FABIO.Expression, SKOS.closeMatch, LRMOO.F2_Expression),
+        (INTERTEXT_TX.Text, SKOS.broadMatch, LRMOO.F2_Expression),
+        (INTERTEXT_TX.SingleText, SKOS.broadMatch, LRMOO.F2_Expression),
+        (INTERTEXT_AF.Work, SKOS.broadMatch, LRMOO.F2_Expression),
+        (INTERTEXT_AB.Reference, SKOS.broadMatch, LRMOO.F2_Expression),
+        (MIMOTEXT.Q2, SKOS.broadMatch, LRMOO.F2_Expression), # literary work
+        (POSTDATA_ANALYSIS.Intertextuality, SKOS.broadMatch, LRMOO.F2_Expression),
+        (URB.Expression, SKOS.closeMatch, LRMOO.F2_Expression),
+    ],
+    # lrmoo:F3_Manifestation
+    LRMOO.F3_Manifestation: [
+        (BIBO.Book, SKOS.broadMatch, LRMOO.F3_Manifestation),
+        (DC.BibliographicResource, SKOS.broadMatch, LRMOO.F3_Manifestation),
+        (FABIO.Manifestation, SKOS.closeMatch, LRMOO.F3_Manifestation),
+        (FOAF.Document, SKOS.broadMatch, LRMOO.F3_Manifestation),
+        (POSTDATA_CORE.Redaction, SKOS.broadMatch, LRMOO.F3_Manifestation),
+        (URB.Manifestation, SKOS.closeMatch, LRMOO.F3_Manifestation),
+    ],
+    # lrmoo:F5_Item
+    LRMOO.F5_Item: [
+        (FABIO.Item, SKOS.closeMatch, LRMOO.F5_Item),
+        (FOAF.Document, SKOS.narrowMatch, LRMOO.F5_Item),
+    ],
+    # intro:INT1_Segment
+    INTRO.INT1_Segment: [
+        (INTERTEXT_AF.Segment, SKOS.broadMatch, INTRO.INT1_Segment),
+        (POSTDATA_CORE.TextUnit, SKOS.broadMatch, INTRO.INT1_Segment),
+    ],
+    # intro:INT2_ActualizationOfFeature
+    INTRO.INT2_ActualizationOfFeature: [
+        (FRBROO.F38_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature),
+        (EFRBROO.F38_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature),
+        (DRACOR.character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature),
+        (GOLEM.G1_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature),
+        (GOLEM.G7_Narrative_Sequence, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature),
+    ],
+    # intro:INT4_Feature
+    INTRO.INT4_Feature: [
+        (INTRO.INT4_Feature, SKOS.broadMatch, INTERTEXT_AB.Mediator),
+        (GOLEM.G9_Narrative_Unit, SKOS.broadMatch, INTRO.INT4_Feature),
+    ],
+    # intro:INT6_Architext
+    INTRO.INT6_Architext: [
+        (INTERTEXT_AF.System, SKOS.broadMatch, INTRO.INT6_Architext),
+    ],
+    # intro:INT11_TypeOfInterrelation
+    INTRO.INT11_TypeOfInterrelation: [
+        (INTERTEXT_AB.IntertexualSpecification, SKOS.closeMatch, INTRO.INT11_TypeOfInterrelation),
+    ],
+    # intro:INT21_TextPassage
+    INTRO.INT21_TextPassage: [
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Part),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.BackMatter),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.BodyMatter),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.CaptionedBox),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Chapter),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.ComplexRunInQuotation),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Footnote),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Formula),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.FormulaBox),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.FrontMatter),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.List),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Section),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Table),
+        (INTRO.INT21_TextPassage, SKOS.broadMatch, INTERTEXT_AB.Mediator),
+        (BIBO.Quote, SKOS.broadMatch, INTRO.INT21_TextPassage),
+        (FABIO.Quotation, SKOS.broadMatch, INTRO.INT21_TextPassage),
+        (INTERTEXT_TX.TextSegment, SKOS.closeMatch, INTRO.INT21_TextPassage),
+        (POSTDATA_CORE.TextUnit, SKOS.closeMatch, INTRO.INT21_TextPassage),
+    ],
+    # intro:INT31_IntertextualRelation
+    INTRO.INT31_IntertextualRelation: [
+        (INTERTEXT_AB.IntertexualRelation, SKOS.closeMatch, INTRO.INT31_IntertextualRelation),
+        (URW.EntityInfluence, SKOS.narrowMatch, INTRO.INT31_IntertextualRelation),
+        (URB.Reception, SKOS.narrowMatch, INTRO.INT31_IntertextualRelation),
+    ],
+    # intro:INT_Character
+    INTRO.INT_Character: [
+        (GOLEM_G0, SKOS.closeMatch, INTRO.INT_Character),
+        (FRBROO.F38_Character, SKOS.broadMatch, INTRO.INT_Character),
+        (EFRBROO.F38_Character, SKOS.broadMatch, INTRO.INT_Character),
+        (DRACOR.character, SKOS.broadMatch, INTRO.INT_Character),
+    ],
+    # intro:INT_Plot
+    INTRO.INT_Plot: [
+        (GOLEM.G14_Narrative_Stoff, SKOS.closeMatch, INTRO.INT_Plot),
+    ],
+    # intro:INT_Motif
+    INTRO.INT_Motif: [
+        (INTRO.INT_Motif, SKOS.broadMatch, INTERTEXT_MT.Motive),
+    ],
+    # intro:INT_Topic
+    INTRO.INT_Topic: [
+        (MIMOTEXT.Q20, SKOS.closeMatch, INTRO.INT_Topic), # thematic concept
+    ],
+}
+
+# Alignments added when the property is used in the input graph
+PROP_ALIGN = {
+    # ecrm:P1_is_identified_by
+    ECRM.P1_is_identified_by: [
+        (DC.identifier, SKOS.closeMatch, ECRM.P1_is_identified_by),
+        (URW.hasIdentifier, SKOS.closeMatch, ECRM.P1_is_identified_by),
+    ],
+    # ecrm:P2_has_type
+    ECRM.P2_has_type: [
+        (DC.type, SKOS.closeMatch, ECRM.P2_has_type),
+        (DRACOR.has_genre, SKOS.broadMatch, ECRM.P2_has_type),
+        (FOAF.gender, SKOS.broadMatch, ECRM.P2_has_type),
+        (MIMOTEXT.P12, SKOS.broadMatch, ECRM.P2_has_type), # genre
+        (POSTDATA_CORE.gender, SKOS.broadMatch, ECRM.P2_has_type),
+        (POSTDATA_CORE.genre, SKOS.broadMatch, ECRM.P2_has_type),
+        (SCHEMA.genre, SKOS.broadMatch, ECRM.P2_has_type),
+        (URW.gender, SKOS.broadMatch, ECRM.P2_has_type),
+    ],
+    # ecrm:P4_has_time-span
+    ECRM_P4: [
+        (DC.date, SKOS.closeMatch, ECRM_P4),
+        (DC.created, SKOS.broadMatch, ECRM_P4),
+        (DC.dateCopyrighted, SKOS.broadMatch, ECRM_P4),
+        (DRACOR.printYear, SKOS.broadMatch, ECRM_P4),
+        (DRACOR.writtenYear, SKOS.broadMatch, ECRM_P4),
+        (MIMOTEXT.P9, SKOS.broadMatch, ECRM_P4), # publication date
+        (POSTDATA_CORE.date, SKOS.closeMatch, ECRM_P4),
+        (POSTDATA_CORE.birthDate, SKOS.broadMatch, ECRM_P4),
+        (POSTDATA_CORE.deathDate, SKOS.broadMatch, ECRM_P4),
+        (SCHEMA.dateCreated, SKOS.broadMatch, ECRM_P4),
+        (SCHEMA.datePublished, SKOS.broadMatch, ECRM_P4),
+        (URW.wasPublishedWhen, SKOS.broadMatch, ECRM_P4),
+        (URB.date, SKOS.closeMatch, ECRM_P4),
+    ],
+    # ecrm:P7_took_place_at
+    ECRM.P7_took_place_at: [
+        (FABIO.hasPlaceOfPublication, SKOS.broadMatch, ECRM.P7_took_place_at),
+        (MIMOTEXT.P10, SKOS.broadMatch, ECRM.P7_took_place_at), # publication place
+        (POSTDATA_CORE.birthPlace, SKOS.broadMatch, ECRM.P7_took_place_at),
+        (POSTDATA_CORE.deathPlace, SKOS.broadMatch, ECRM.P7_took_place_at),
+        (SCHEMA.locationCreated, SKOS.broadMatch, ECRM.P7_took_place_at),
+        (URW.wasPublishedWhere, SKOS.broadMatch, ECRM.P7_took_place_at),
+    ],
+    # ecrm:P7i_witnessed
+    ECRM.P7i_witnessed: [
+        (POSTDATA_CORE.birthPlaceOf, SKOS.broadMatch, ECRM.P7i_witnessed),
+        (POSTDATA_CORE.deathPlaceOf, SKOS.broadMatch, ECRM.P7i_witnessed),
+    ],
+    # ecrm:P14_carried_out_by
+    ECRM.P14_carried_out_by: [
+        (BIBO.editor, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (DRACOR.has_author, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (FOAF.maker, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (MIMOTEXT.P5, SKOS.broadMatch, ECRM.P14_carried_out_by), # has author
+        (POSTDATA_CORE.hasCreator, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (POSTDATA_CORE.hasEditor, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (SCHEMA.author, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (SCHEMA.creator, SKOS.broadMatch, ECRM.P14_carried_out_by),
+        (URW.wasPublishedBy, SKOS.broadMatch, ECRM.P14_carried_out_by),
+    ],
+    # ecrm:P14i_performed
+    ECRM.P14i_performed: [
+        (DC.creator, SKOS.broadMatch, ECRM.P14i_performed),
+        (DC.publisher, SKOS.broadMatch, ECRM.P14i_performed),
+        (FOAF.made, SKOS.broadMatch, ECRM.P14i_performed),
+        (MIMOTEXT.P7, SKOS.broadMatch, ECRM.P14i_performed), # author of
+        (POSTDATA_CORE.isCreatorOf, SKOS.broadMatch, ECRM.P14i_performed),
+        (POSTDATA_CORE.editorOf, SKOS.broadMatch, ECRM.P14i_performed),
+    ],
+    # ecrm:P102_has_title
+    ECRM.P102_has_title: [
+        (DC.title, SKOS.closeMatch, ECRM.P102_has_title),
+        (MIMOTEXT.P4, SKOS.closeMatch, ECRM.P102_has_title), # title
+    ],
+    # ecrm:P131_is_identified_by
+    ECRM.P131_is_identified_by: [
+        (FOAF.name, SKOS.closeMatch, ECRM.P131_is_identified_by),
+        (MIMOTEXT.P8, SKOS.closeMatch, ECRM.P131_is_identified_by), # name
+    ],
+    # ecrm:P138i_has_representation
+    ECRM.P138i_has_representation: [
+        (FOAF.img, SKOS.broadMatch, ECRM.P138i_has_representation),
+        (MIMOTEXT.P21, SKOS.broadMatch, ECRM.P138i_has_representation), # full work available at URL
+    ],
+    # lrmoo:R3_realises
+    LRMOO.R3_realises: [
+        (URB.realization, SKOS.closeMatch, LRMOO.R3_realises),
+    ],
+    # lrmoo:R3_is_realised_in
+    LRMOO.R3_is_realised_in: [
+        (URB.realizationOf, SKOS.closeMatch, LRMOO.R3_is_realised_in),
+    ],
+    # lrmoo:R4_embodies
+    LRMOO.R4_embodies: [
+        (URB.embodimentOf, SKOS.closeMatch, LRMOO.R4_embodies),
+    ],
+    # lrmoo:R4i_is_embodied_in
+    LRMOO.R4i_is_embodied_in: [
+        (URB.embodiment, SKOS.closeMatch, LRMOO.R4i_is_embodied_in),
+    ],
+    # intro:R12i_isReferredToEntity
+    INTRO.R12i_isReferredToEntity: [
+        (INTRO.R12i_isReferredToEntity, SKOS.closeMatch, INTERTEXT_AB.there),
+    ],
+    # intro:R13i_isReferringEntity
+    INTRO.R13i_isReferringEntity: [
+        (INTRO.R13i_isReferringEntity, SKOS.closeMatch, INTERTEXT_AB.here),
+    ],
+    # intro:R19i_isTypeOf
+    INTRO.R19i_isTypeOf: [
+        (INTERTEXT_AB.specifiedBy, SKOS.broadMatch, INTRO.R19i_isTypeOf),
+        (POSTDATA_ANALYSIS.typeOfIntertextuality, SKOS.broadMatch, INTRO.R19i_isTypeOf),
+    ],
+    # intro:R22i_relationIsBasedOnSimilarity
+    INTRO.R22i_relationIsBasedOnSimilarity: [
+        (INTRO.R22i_relationIsBasedOnSimilarity, SKOS.broadMatch, INTERTEXT_AB.mediatedBy),
+    ],
+    # intro:R24_hasRelatedEntity
+    INTRO.R24_hasRelatedEntity: [
+        (INTRO.R24_hasRelatedEntity, SKOS.broadMatch, INTERTEXT_AB.mediatedBy),
+    ],
+    # intro:R30_hasTextPassage
+    INTRO.R30_hasTextPassage: [
+        (INTRO.R30_hasTextPassage, SKOS.broadMatch, DC.hasPart),
+        (POSTDATA_CORE.hasTextUnit, SKOS.narrowMatch, INTRO.R30_hasTextPassage),
+    ],
+    # prov:wasDerivedFrom
+    PROV.wasDerivedFrom: [
+        (DC.source, SKOS.closeMatch, PROV.wasDerivedFrom),
+        (MIMOTEXT.P17, SKOS.broadMatch, PROV.wasDerivedFrom), # reference URL
+    ],
+}
+
+# Definitions of the sappho_prop properties added by the complex-property passes.
+# A chain step given as a (predicate, object) pair stands for an anonymous property, e.g. (OWL.inverseOf, p).
+PROPERTY_DEFS = {
+    # sappho_prop:has_manifestation
+    SAPPHO_PROP.has_manifestation: dict(
+        comment="A F1_Work has a F3_Manifestation.",
+        domains=[LRMOO.F1_Work],
+        ranges=[LRMOO.F3_Manifestation],
+        close=[FABIO.hasManifestation, POSTDATA_CORE.isRealisedThrough, URB.manifestation],
+        chain=[LRMOO.R3_is_realised_in, LRMOO.R4i_is_embodied_in],
+    ),
+    # sappho_prop:has_portrayal
+    SAPPHO_PROP.has_portrayal: dict(
+        comment="A F1_Work has a F5_Item.",
+        domains=[LRMOO.F1_Work],
+        ranges=[LRMOO.F5_Item],
+        close=[FABIO.hasPortrayal],
+        chain=[LRMOO.R3_is_realised_in, LRMOO.R4i_is_embodied_in, LRMOO.R7i_is_exemplified_by],
+    ),
+    # sappho_prop:has_representation
+    SAPPHO_PROP.has_representation: dict(
+        comment="A F2_Expression has a F5_Item.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[LRMOO.F5_Item],
+        close=[FABIO.hasRepresentation],
+        chain=[LRMOO.R4i_is_embodied_in, LRMOO.R7i_is_exemplified_by],
+    ),
+    # sappho_prop:about
+    SAPPHO_PROP.about: dict(
+        comment="Link from a F2_Expression to an INT_Topic.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[INTRO.INT_Topic],
+        close=[DC.subject, FOAF.topic, MIMOTEXT.P36, SCHEMA.about], # P36: about
+        chain=[INTRO.R18_showsActualization, INTRO.R17_actualizesFeature],
+    ),
+    # sappho_prop:expr_relation
+    SAPPHO_PROP.expr_relation: dict(
+        comment="A relation between two F2_Expressions.",
+        types=[OWL.SymmetricProperty],
+        domains=[LRMOO.F2_Expression],
+        ranges=[LRMOO.F2_Expression],
+        close=[
+            DC.relation,
+            MIMOTEXT.P34, # relation
+            POSTDATA_ANALYSIS.hasRelationsWith,
+            POSTDATA_ANALYSIS.isRelatedWith,
+        ],
+        narrow=[
+            POSTDATA_ANALYSIS.hasDerivedWork,
+            POSTDATA_ANALYSIS.isDerivedFrom,
+            POSTDATA_ANALYSIS.isRelatedContemporaneouslyWith,
+            POSTDATA_ANALYSIS.hasContemporaryRelation,
+            POSTDATA_ANALYSIS.usesAsSource,
+            POSTDATA_ANALYSIS.isSource,
+            URW.influenced,
+            URW.influencedBy,
+        ],
+        chain=[
+            (OWL.inverseOf, INTRO.R18i_actualizationFoundOn),
+            INTRO.R24i_isRelatedEntity,
+            INTRO.R24_hasRelatedEntity,
+            INTRO.R18i_actualizationFoundOn,
+        ],
+    ),
+    # sappho_prop:expr_possibly_cites
+    SAPPHO_PROP.expr_possibly_cites: dict(
+        comment="A F2_Expression possibly cites a F2_Expression.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[LRMOO.F2_Expression],
+        chain=[
+            INTRO.R30_hasTextPassage,
+            (OWL.inverseOf, INTRO.R24_hasRelatedEntity),
+            INTRO.R24_hasRelatedEntity,
+            (OWL.inverseOf, INTRO.R30i_isTextPassageOf),
+        ],
+    ),
+    # sappho_prop:expr_possibly_cited_by
+    SAPPHO_PROP.expr_possibly_cited_by: dict(
+        comment="A F2_Expression is possibly cited by a F2_Expression.",
+        inverse_of=SAPPHO_PROP.expr_possibly_cites,
+        domains=[LRMOO.F2_Expression],
+        ranges=[LRMOO.F2_Expression],
+    ),
+    # sappho_prop:tp_possibly_cites
+    SAPPHO_PROP.tp_possibly_cites: dict(
+        comment="A F2_Expression possibly cites an INT21_TextPassage.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[INTRO.INT21_TextPassage],
+        chain=[INTRO.R30_hasTextPassage],
+    ),
+    # sappho_prop:tp_possibly_cited_by
+    SAPPHO_PROP.tp_possibly_cited_by: dict(
+        comment="An INT21_TextPassage is possibly cited by a F2_Expression.",
+        inverse_of=SAPPHO_PROP.tp_possibly_cites,
+        domains=[INTRO.INT21_TextPassage],
+        ranges=[LRMOO.F2_Expression],
+    ),
+    # sappho_prop:expr_references
+    SAPPHO_PROP.expr_references: dict(
+        comment="A F2_Expression references an E21_Person, an E53_Place or a F2_Expression.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[ECRM.E21_Person, ECRM.E53_Place, LRMOO.F2_Expression],
+        close=[DC.references, POSTDATA_ANALYSIS.reference],
+        narrow=[MIMOTEXT.P50], # mentions
+        chain=[INTRO.R18_showsActualization, ECRM.P67_refers_to],
+    ),
+    # sappho_prop:referenced_by_expr
+    SAPPHO_PROP.referenced_by_expr: dict(
+        comment="An E21_Person, an E53_Place or a F2_Expression is referenced by a F2_Expression.",
+        inverse_of=SAPPHO_PROP.expr_references,
+        domains=[ECRM.E21_Person, ECRM.E53_Place, LRMOO.F2_Expression],
+        ranges=[LRMOO.F2_Expression],
+    ),
+    # sappho_prop:references_person
+    SAPPHO_PROP.references_person: dict(
+        comment="A F2_Expression references an E21_Person.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[ECRM.E21_Person],
+        chain=[INTRO.R18_showsActualization, ECRM.P67_refers_to],
+    ),
+    # sappho_prop:person_referenced_by
+    SAPPHO_PROP.person_referenced_by: dict(
+        comment="An E21_Person is referenced by a F2_Expression.",
+        inverse_of=SAPPHO_PROP.references_person,
+        domains=[ECRM.E21_Person],
+        ranges=[LRMOO.F2_Expression],
+    ),
+    # sappho_prop:references_place
+    SAPPHO_PROP.references_place: dict(
+        comment="A F2_Expression references an E53_Place.",
+        domains=[LRMOO.F2_Expression],
+        ranges=[ECRM.E53_Place],
+        chain=[INTRO.R18_showsActualization, ECRM.P67_refers_to],
+    ),
+    # sappho_prop:place_referenced_by
+    SAPPHO_PROP.place_referenced_by: dict(
+        comment="An E53_Place is referenced by a F2_Expression.",
+        inverse_of=SAPPHO_PROP.references_place,
+        domains=[ECRM.E53_Place],
+        ranges=[LRMOO.F2_Expression],
+    ),
+    # sappho_prop:has_character
+    SAPPHO_PROP.has_character: dict(
+        domains=[LRMOO.F2_Expression],
+        ranges=[INTRO.INT2_ActualizationOfFeature],
+        close=[GOLEM.GP1i_has_character],
+    ),
+    # sappho_prop:is_character_in
+    SAPPHO_PROP.is_character_in: dict(
+        domains=[INTRO.INT2_ActualizationOfFeature],
+        ranges=[LRMOO.F2_Expression],
+        close=[GOLEM.GP1i_is_character_in],
+    ),
+}
+
 # HTTP helpers
 SPARQL_URL = "https://query.wikidata.org/sparql"
 USER_AGENT = "SapphoMapAndAlignBot/1.0 (laura.untner@fu-berlin.de)"
 HTTP_TIMEOUT = 120
 MAX_RETRIES = 5
+BATCH_SIZE = 200
+MAX_WORKERS = 4
 
 def _parse_retry_after(header_val: str) -> Optional[float]:
     if not header_val:
@@ -72,10 +568,11 @@ def _parse_retry_after(header_val: str) -> Optional[float]:
 
 def _make_session() -> requests.Session:
     sess = requests.Session()
-    sess.headers.update({"Accept": "application/sparql-results+json", "User-Agent": USER_AGENT})
+    sess.headers.update({"Accept": "application/sparql-results+json", "Accept-Encoding": "gzip, deflate",
+                         "User-Agent": USER_AGENT})
     retry = Retry(total=0, respect_retry_after_header=True, backoff_factor=0,
                   status_forcelist=(429, 500, 502, 503, 504),
-                  allowed_methods=frozenset(["GET"]), raise_on_status=False)
+                  allowed_methods=frozenset(["GET", "POST"]), raise_on_status=False)
     adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
     sess.mount("https://", adapter); sess.mount("http://", adapter)
     return sess
@@ -86,9 +583,12 @@ def _sparql_query(query: str, *, max_retries: int = MAX_RETRIES) -> Dict[str, An
     tries = 0
     while True:
         tries += 1
-        resp = _SESSION.get(SPARQL_URL, params={"query": query}, timeout=HTTP_TIMEOUT)
+        # POST keeps long VALUES lists out of the URL (WDQS rejects overly long GET requests)
+        resp = _SESSION.post(SPARQL_URL, data={"query": query},
+                             headers={"Content-Type": "application/x-www-form-urlencoded"},
+                             timeout=HTTP_TIMEOUT)
         if resp.status_code == 200:
-            return resp.json()
+            return orjson.loads(resp.content) if orjson is not None else resp.json()
         if resp.status_code == 429:
             ra = _parse_retry_after(resp.headers.get("Retry-After", "")) or 5.0
             print(f"429 Too Many Requests – waiting {ra:.1f}s (try {tries}/{max_retries})")
@@ -105,6 +605,12 @@ def _sparql_query(query: str, *, max_retries: int = MAX_RETRIES) -> Dict[str, An
 
 # Mapping
 
+# URI builders for external identifiers (bound str.__mod__ avoids per-row f-string formatting)
+_GND = "http://d-nb.info/gnd/%s".__mod__
+_VIAF = "http://viaf.org/viaf/%s".__mod__
+_GEO = "http://sws.geonames.org/%s/".__mod__
+_GR = "https://www.goodreads.com/work/%s".__mod__
+
 def normalize_uri(raw, prefix_map):
     if raw.startswith("http://") or raw.startswith("https://"):
         return raw
@@ -154,55 +660,226 @@ def query_wikidata_batch(qids):
     for row in results['results']['bindings']:
         uri_item = row['item']['value']
         qid = uri_item.rsplit("/", 1)[1]
+        ids = batch_ids[qid]
 
-        if 'schemaOrg' in row:
-            raw = row['schemaOrg']['value']
-            batch_ids[qid]['schema'].append(normalize_uri(raw, prefix_map))
+        if v := row.get('schemaOrg'):
+            ids['schema'].append(normalize_uri(v['value'], prefix_map))
 
-        if 'dbpedia' in row:
-            raw = row['dbpedia']['value']
-            batch_ids[qid]['dbpedia'].append(normalize_uri(raw, prefix_map))
+        if v := row.get('dbpedia'):
+            ids['dbpedia'].append(normalize_uri(v['value'], prefix_map))
 
-        if 'gnd' in row:
-            batch_ids[qid]['gnd'].append(f"http://d-nb.info/gnd/{row['gnd']['value']}")
+        if v := row.get('gnd'):
+            ids['gnd'].append(_GND(v['value']))
         
-        if 'viaf' in row:
-            batch_ids[qid]['viaf'].append(f"http://viaf.org/viaf/{row['viaf']['value']}")
+        if v := row.get('viaf'):
+            ids['viaf'].append(_VIAF(v['value']))
         
-        if 'geonames' in row:
-            batch_ids[qid]['geonames'].append(f"http://sws.geonames.org/{row['geonames']['value']}/")
+        if v := row.get('geonames'):
+            ids['geonames'].append(_GEO(v['value']))
         
-        if 'grWork' in row:
-            batch_ids[qid]['goodreads'].append(f"https://www.goodreads.com/work/{row['grWork']['value']}")
+        if v := row.get('grWork'):
+            ids['goodreads'].append(_GR(v['value']))
 
     return batch_ids
 
+def fetch_wikidata_ids(qids, batch_size=BATCH_SIZE, max_workers=MAX_WORKERS):
+    # Split into VALUES batches and keep a few of them in flight over the shared keep-alive session
+    batches = [qids[i:i + batch_size] for i in range(0, len(qids), batch_size)]
+    results = {}
+    if not batches:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+        for batch_ids in pool.map(query_wikidata_batch, batches):
+            results.update(batch_ids)
+    return results
+
 # Get creation year
+_MISSING = object()
+
 def extract_year(label_lit):
     return int(str(label_lit))
 
 def get_creation_year(g, expr):
     # Expression_Creation
     for ec in g.objects(expr, LRMOO.R17i_was_created_by):
-        for ts in g.objects(ec, ECRM["P4_has_time-span"]):
+        for ts in g.objects(ec, ECRM_P4):
             return extract_year(g.value(ts, RDFS.label))
     # Manifestation_Creation fallback
     for manif in g.objects(expr, LRMOO.R4i_is_embodied_in):
         for mc in g.subjects(LRMOO.R24_created, manif):
-            for ts in g.objects(mc, ECRM["P4_has_time-span"]):
+            for ts in g.objects(mc, ECRM_P4):
                 return extract_year(g.value(ts, RDFS.label))
     return None
 
+# Property definitions
+def rdf_list(buf, items):
+    # Same rdf:first/rdf:rest cells rdflib's Collection would write, but into the batch buffer
+    head = node = BNode()
+    for i, item in enumerate(items):
+        buf.append((node, RDF.first, item))
+        nxt = BNode() if i < len(items) - 1 else RDF.nil
+        buf.append((node, RDF.rest, nxt))
+        node = nxt
+    return head
+
+def define_property(buf, prop, comment=None, types=(), domains=(), ranges=(),
+                    close=(), narrow=(), inverse_of=None, chain=()):
+    buf.append((prop, RDF.type, OWL.ObjectProperty))
+    buf.append((prop, RDFS.label, Literal(prop[len(SAPPHO_PROP):], lang="en")))
+    if comment:
+        buf.append((prop, RDFS.comment, Literal(comment, lang="en")))
+    for t in types:
+        buf.append((prop, RDF.type, t))
+    if inverse_of is not None:
+        buf.append((prop, OWL.inverseOf, inverse_of))
+    for d in domains:
+        buf.append((prop, RDFS.domain, d))
+    for r in ranges:
+        buf.append((prop, RDFS.range, r))
+    for m in close:
+        buf.append((prop, SKOS.closeMatch, m))
+    for m in narrow:
+        buf.append((prop, SKOS.narrowMatch, m))
+    if chain:
+        steps = []
+        for step in chain:
+            if isinstance(step, tuple):
+                node = BNode()
+                buf.append((node, *step))
+                step = node
+            steps.append(step)
+        buf.append((prop, OWL.propertyChainAxiom, rdf_list(buf, steps)))
+
+# Materialization
+# Each helper only reads the graph and the prebuilt indexes and returns the triples to add.
+
+def manifestation_links(g, expr2mani):
+    has_manifestation = SAPPHO_PROP.has_manifestation
+    out = []
+    for work in g.subjects(RDF.type, LRMOO.F1_Work):
+        for expr in g.objects(work, LRMOO.R3_is_realised_in):
+            for mani in expr2mani.get(expr, ()):
+                out.append((work, has_manifestation, mani))
+    return out
+
+def portrayal_links(g, expr2mani, mani2item):
+    has_portrayal = SAPPHO_PROP.has_portrayal
+    out = []
+    for work in g.subjects(RDF.type, LRMOO.F1_Work):
+        for expr in g.objects(work, LRMOO.R3_is_realised_in):
+            for mani in expr2mani.get(expr, ()):
+                for item in mani2item.get(mani, ()):
+                    out.append((work, has_portrayal, item))
+    return out
+
+def representation_links(expressions, expr2mani, mani2item):
+    has_representation = SAPPHO_PROP.has_representation
+    out = []
+    for expr in expressions:
+        for mani in expr2mani.get(expr, ()):
+            for item in mani2item.get(mani, ()):
+                out.append((expr, has_representation, item))
+    return out
+
+def topic_links(expressions, expr2acts, act2feat, topics):
+    about = SAPPHO_PROP.about
+    out = []
+    for expr in expressions:
+        for act in expr2acts.get(expr, ()):
+            topic = act2feat.get(act)
+            if topic in topics:
+                out.append((expr, about, topic))
+    return out
+
+def relation_links(g, act2exprs):
+    expr_relation = SAPPHO_PROP.expr_relation
+    out = []
+    for rel in g.subjects(RDF.type, INTRO.INT31_IntertextualRelation):
+        exprs = set().union(*(act2exprs.get(act, ())
+                              for act in g.objects(rel, INTRO.R24_hasRelatedEntity)))
+        for e1, e2 in combinations(exprs, 2):
+            out.append((e1, expr_relation, e2))
+            out.append((e2, expr_relation, e1))
+    return out
+
+def direction_links(directions):
+    has_referring = INTRO.R13_hasReferringEntity
+    is_referring = INTRO.R13i_isReferringEntity
+    has_referred_to = INTRO.R12_hasReferredToEntity
+    is_referred_to = INTRO.R12i_isReferredToEntity
+    out = []
+    for rel, younger_expr, older_expr, younger_tp, older_tp in directions:
+        out.append((rel, has_referring, younger_expr))
+        out.append((younger_expr, is_referring, rel))
+        out.append((rel, has_referred_to, older_expr))
+        out.append((older_expr, is_referred_to, rel))
+    return out
+
+def citation_links(directions):
+    expr_possibly_cites = SAPPHO_PROP.expr_possibly_cites
+    expr_possibly_cited_by = SAPPHO_PROP.expr_possibly_cited_by
+    tp_possibly_cites = SAPPHO_PROP.tp_possibly_cites
+    tp_possibly_cited_by = SAPPHO_PROP.tp_possibly_cited_by
+    out = []
+    for _rel, younger_expr, older_expr, younger_tp, older_tp in directions:
+        out.append((younger_expr, expr_possibly_cites, older_expr))
+        out.append((older_expr,   expr_possibly_cited_by, younger_expr))
+        out.append((younger_expr, tp_possibly_cites, older_tp))
+        out.append((older_tp,   tp_possibly_cited_by, younger_expr))
+    return out
+
+def reference_links(expressions, expr2acts, act2refs, persons, places):
+    expr_references = SAPPHO_PROP.expr_references
+    references_person = SAPPHO_PROP.references_person
+    references_place = SAPPHO_PROP.references_place
+    out = []
+    for expr in expressions:
+        for act in expr2acts.get(expr, ()):
+            for target in act2refs.get(act, ()):
+                out.append((expr, expr_references, target))
+                if target in persons:
+                    out.append((expr, references_person, target))
+                elif target in places:
+                    out.append((expr, references_place, target))
+    return out
+
+def character_links(expressions, expr2acts, act2feat, characters):
+    has_character = SAPPHO_PROP.has_character
+    is_character_in = SAPPHO_PROP.is_character_in
+    out = []
+    for expr in expressions:
+        for act in expr2acts.get(expr, ()):
+            feat = act2feat.get(act)
+            if feat in characters:
+                out.append((expr, has_character,    act))
+                out.append((act,  is_character_in, expr))
+    return out
+
 # Arguments
 def parse_args(argv=None):
     p = argparse.ArgumentParser(
         description="Add ontology alignments and external identifiers (DBpedia, GeoNames, …) to a TTL file."
     )
     p.add_argument("--input",  type=Path, help="Input TTL (e.g. examples/outputs/all.ttl)")
-    p.add_argument("--output", type=Path, help="Output TTL (default: <input>_mapped-and-aligned.ttl)")
+    p.add_argument("--output", type=Path, help="Output file (default: <input>_mapped-and-aligned.ttl / .nt)")
+    p.add_argument("--format", choices=("turtle", "nt"), default="turtle",
+                   help="Output format (default: turtle); nt skips the Turtle pretty-printer and is much faster on large graphs")
     p.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
     return p.parse_args(argv)
 
+# Prefix handling
+def without_prefixes(g, base):
+    # rdflib cannot unbind a prefix, so if the input brought one along for base, copy the graph without it
+    stale = {prefix for prefix, ns in g.namespaces() if str(ns).startswith(base)}
+    if not stale:
+        return g
+    out = Graph(bind_namespaces="none")
+    for prefix, ns in g.namespaces():
+        if prefix not in stale:
+            out.bind(prefix, ns, override=True, replace=True)
+    out += g
+    return out
+
 # Run script
 def main(argv=None):
     args = parse_args(argv)
@@ -226,7 +903,8 @@ def main(argv=None):
             raise SystemExit("--input is required (no default TTL found in examples/outputs)")
 
     if args.output is None:
-        args.output = args.input.with_name(args.input.stem + "_mapped-and-aligned.ttl")
+        suffix = ".nt" if args.format == "nt" else ".ttl"
+        args.output = args.input.with_name(args.input.stem + "_mapped-and-aligned" + suffix)
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
@@ -249,423 +927,118 @@ def main(argv=None):
             subjects_by_qid.setdefault(m.group(1), []).append(subj)
 
     qids = list(subjects_by_qid.keys())
-    batch_results = query_wikidata_batch(qids) if qids else {}
+    batch_results = fetch_wikidata_ids(qids)
+
+    # Shared DBpedia/Schema.org targets recur across subjects, so build each URIRef once
+    uri_cache = {}
+    def _ref(u):
+        r = uri_cache.get(u)
+        if r is None:
+            r = uri_cache[u] = URIRef(u)
+        return r
 
     for qid, subjects in subjects_by_qid.items():
         for uri_list in batch_results.get(qid, {}).values():
             for raw in uri_list:
                 uri = normalize_uri(raw, prefix_map)
                 if uri.startswith("http://") or uri.startswith("https://"):
-                    new_obj = URIRef(uri)
+                    new_obj = _ref(uri)
                     for subj in subjects:
                         if (subj, OWL.sameAs, new_obj) not in g:
                             g.add((subj, OWL.sameAs, new_obj))
     
     # Alignment
 
-    g.bind("sappho_prop", SAPPHO_PROP)
-    g.bind("ecrm", ECRM)
-    g.bind("crm", CRM)
-    g.bind("frbroo", FRBROO)
-    g.bind("efrbroo", EFRBROO)
-    g.bind("lrmoo", LRMOO)
-    g.bind("intro", INTRO)
-    g.bind("skos", SKOS)
-    
-    g.bind("bibo", BIBO)
-    g.bind("cito", CITO)
-    g.bind("dc", DC)
-    g.bind("doco", DOCO)
-    g.bind("dracor", DRACOR)
-    g.bind("fabio", FABIO)
-    g.bind("foaf", FOAF)
-    g.bind("golem", GOLEM)
-    g.bind("intertext_ab", INTERTEXT_AB)
-    g.bind("intertext_tx", INTERTEXT_TX)
-    g.bind("intertext_af", INTERTEXT_AF)
-    g.bind("intertext_mt", INTERTEXT_MT)
-    g.bind("mimotext", MIMOTEXT)
-    g.bind("postdata_core", POSTDATA_CORE)
-    g.bind("postdata_analysis", POSTDATA_ANALYSIS)
-    g.bind("schema", SCHEMA)
-    g.bind("urw", URW, override=True)
-    g.bind("urb", URB, override=True)
-
-    ## Classes ##
-    
-    # ecrm:E21_Person
-    if any(g.triples((None, RDF.type, ECRM.E21_Person))):
-        g.add((DRACOR.author, SKOS.broadMatch, ECRM.E21_Person))
-        g.add((ECRM.E21_Person, SKOS.broadMatch, FOAF.Agent))
-        g.add((MIMOTEXT.Q11, SKOS.broadMatch, ECRM.E21_Person)) # author
-        g.add((MIMOTEXT.Q10, SKOS.closeMatch, ECRM.E21_Person)) # person
-        g.add((POSTDATA_CORE.Person, SKOS.closeMatch, ECRM.E21_Person)) 
-        g.add((URW.Agent, SKOS.narrowMatch, ECRM.E21_Person))
-        g.add((URW.Person, SKOS.closeMatch, ECRM.E21_Person))
-    
-    # ecrm:E35_Title
-    if any(g.triples((None, RDF.type, ECRM.E35_Title))):
-        g.add((DOCO.Title, SKOS.closeMatch, ECRM.E35_Title))
-    
-    # ecrm:E74_Group
-    if any(g.triples((None, RDF.type, ECRM.E74_Group))):
-        g.add((ECRM.E74_Group, SKOS.broadMatch, FOAF.Agent))
-        g.add((POSTDATA_CORE.Organisation, SKOS.broadMatch, ECRM.E74_Group))
-        g.add((POSTDATA_CORE.Organization, SKOS.broadMatch, ECRM.E74_Group))
-        g.add((URW.Organization, SKOS.broadMatch, ECRM.E74_Group))
-        g.add((URW.Publisher, SKOS.broadMatch, ECRM.E74_Group))
-
-    # ecrm:E52_Time-Span
-    if any(g.triples((None, RDF.type, ECRM["E52_Time-Span"]))):
-        g.add((DC.PeriodOfTime, SKOS.closeMatch, ECRM["E52_Time-Span"]))
-
-    # ecrm:E53_Place
-    if any(g.triples((None, RDF.type, ECRM.E53_Place))):
-        g.add((DC.Location, SKOS.closeMatch, ECRM.E53_Place))
-        g.add((MIMOTEXT.Q26, SKOS.closeMatch, ECRM.E53_Place)) # spatial concept
-        g.add((POSTDATA_CORE.Place, SKOS.closeMatch, ECRM.E53_Place))
-        g.add((POSTDATA_CORE.Place, SKOS.closeMatch, ECRM.E53_Place))
-        g.add((URW.Place, SKOS.closeMatch, ECRM.E53_Place))
-
-    # ecrm:E55_Type
-    if any(g.triples((None, RDF.type, ECRM.E55_Type))):
-        g.add((DRACOR.genre, SKOS.broadMatch, ECRM.E55_Type))
-        g.add((INTERTEXT_TX.TextGenre, SKOS.broadMatch, ECRM.E55_Type))
-        g.add((MIMOTEXT.Q33, SKOS.broadMatch, ECRM.E55_Type)) # genre
-        
-    # ecrm:E73_Information_Object
-    if any(g.triples((None, RDF.type, ECRM.E73_Information_Object))):
-        g.add((FABIO.DigitalItem, SKOS.broadMatch, ECRM.E73_Information_Object))  
-    
-    # lrmoo:F1_Work
-    if any(g.triples((None, RDF.type, LRMOO.F1_Work))):
-        g.add((FABIO.Work, SKOS.closeMatch, LRMOO.F1_Work))
-        g.add((FABIO.LiteraryArtisticWork, SKOS.broadMatch, LRMOO.F1_Work))
-        g.add((POSTDATA_CORE.PoeticWork, SKOS.broadMatch, LRMOO.F1_Work))
-        g.add((URB.Work, SKOS.closeMatch, LRMOO.F1_Work))
-    
-    # lrmoo:F2_Expression
-    if any(g.triples((None, RDF.type, LRMOO.F2_Expression))):
-        g.add((FOAF.Document, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((BIBO.Manuscript, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((DRACOR.play, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((FABIO.Expression, SKOS.closeMatch, LRMOO.F2_Expression))
-        g.add((INTERTEXT_TX.Text, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((INTERTEXT_TX.SingleText, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((INTERTEXT_AF.Work, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((INTERTEXT_AB.Reference, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((MIMOTEXT.Q2, SKOS.broadMatch, LRMOO.F2_Expression)) # literary work
-        g.add((POSTDATA_ANALYSIS.Intertextuality, SKOS.broadMatch, LRMOO.F2_Expression))
-        g.add((URB.Expression, SKOS.closeMatch, LRMOO.F2_Expression))
-
-    # lrmoo:F3_Manifestation
-    if any(g.triples((None, RDF.type, LRMOO.F3_Manifestation))):
-        g.add((BIBO.Book, SKOS.broadMatch, LRMOO.F3_Manifestation))
-        g.add((DC.BibliographicResource, SKOS.broadMatch, LRMOO.F3_Manifestation))
-        g.add((FABIO.Manifestation, SKOS.closeMatch, LRMOO.F3_Manifestation))
-        g.add((FOAF.Document, SKOS.broadMatch, LRMOO.F3_Manifestation))
-        g.add((POSTDATA_CORE.Redaction, SKOS.broadMatch, LRMOO.F3_Manifestation))
-        g.add((URB.Manifestation, SKOS.closeMatch, LRMOO.F3_Manifestation))
-
-    # lrmoo:F5_Item
-    if any(g.triples((None, RDF.type, LRMOO.F5_Item))):
-        g.add((FABIO.Item, SKOS.closeMatch, LRMOO.F5_Item))
-        g.add((FOAF.Document, SKOS.narrowMatch, LRMOO.F5_Item))
-    
-    # intro:INT1_Segment
-    if any(g.triples((None, RDF.type, INTRO.INT1_Segment))):
-        g.add((INTERTEXT_AF.Segment, SKOS.broadMatch, INTRO.INT1_Segment))
-        g.add((POSTDATA_CORE.TextUnit, SKOS.broadMatch, INTRO.INT1_Segment))
-    
-    # intro:INT2_ActualizationOfFeature
-    if any(g.triples((None, RDF.type, INTRO.INT2_ActualizationOfFeature))):
-        g.add((FRBROO.F38_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature))
-        g.add((EFRBROO.F38_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature))
-        g.add((DRACOR.character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature))
-        g.add((GOLEM.G1_Character, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature))
-        g.add((GOLEM.G7_Narrative_Sequence, SKOS.broadMatch, INTRO.INT2_ActualizationOfFeature))
-    
-    # intro:INT4_Feature
-    if any(g.triples((None, RDF.type, INTRO.INT4_Feature))):
-        g.add((INTRO.INT4_Feature, SKOS.broadMatch, INTERTEXT_AB.Mediator))
-        g.add((GOLEM.G9_Narrative_Unit, SKOS.broadMatch, INTRO.INT4_Feature))
-    
-    # intro:INT6_Architext
-    if any(g.triples((None, RDF.type, INTRO.INT6_Architext))):
-        g.add((INTERTEXT_AF.System, SKOS.broadMatch, INTRO.INT6_Architext))
-    
-    # intro:INT11_TypeOfInterrelation
-    if any(g.triples((None, RDF.type, INTRO.INT11_TypeOfInterrelation))):
-        g.add((INTERTEXT_AB.IntertexualSpecification, SKOS.closeMatch, INTRO.INT11_TypeOfInterrelation))
-    
-    # intro:INT21_TextPassage
-    if any(g.triples((None, RDF.type, INTRO.INT21_TextPassage))):
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Part))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.BackMatter))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.BodyMatter))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.CaptionedBox))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Chapter))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.ComplexRunInQuotation))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Footnote))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Formula))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.FormulaBox))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.FrontMatter))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.List))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Section))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, DOCO.Table))
-        g.add((INTRO.INT21_TextPassage, SKOS.broadMatch, INTERTEXT_AB.Mediator))
-        g.add((BIBO.Quote, SKOS.broadMatch, INTRO.INT21_TextPassage))
-        g.add((FABIO.Quotation, SKOS.broadMatch, INTRO.INT21_TextPassage))
-        g.add((INTERTEXT_TX.TextSegment, SKOS.closeMatch, INTRO.INT21_TextPassage))
-        g.add((POSTDATA_CORE.TextUnit, SKOS.closeMatch, INTRO.INT21_TextPassage))
-    
-    # intro:INT31_IntertextualRelation
-    if any(g.triples((None, RDF.type, INTRO.INT31_IntertextualRelation))):
-        g.add((INTERTEXT_AB.IntertexualRelation, SKOS.closeMatch, INTRO.INT31_IntertextualRelation))
-        g.add((URW.EntityInfluence, SKOS.narrowMatch, INTRO.INT31_IntertextualRelation))
-        g.add((URB.Reception, SKOS.narrowMatch, INTRO.INT31_IntertextualRelation))
-
-    # intro:INT_Character
-    if any(g.triples((None, RDF.type, INTRO.INT_Character))):
-        g.add((GOLEM["G0_Character-Stoff"], SKOS.closeMatch, INTRO.INT_Character))
-        g.add((FRBROO.F38_Character, SKOS.broadMatch, INTRO.INT_Character))
-        g.add((EFRBROO.F38_Character, SKOS.broadMatch, INTRO.INT_Character))
-        g.add((DRACOR.character, SKOS.broadMatch, INTRO.INT_Character))
-    
-    # intro:INT_Plot
-    if any(g.triples((None, RDF.type, INTRO.INT_Plot))):
-        g.add((GOLEM.G14_Narrative_Stoff, SKOS.closeMatch, INTRO.INT_Plot))
-    
-    # intro:INT_Motif
-    if any(g.triples((None, RDF.type, INTRO.INT_Motif))):
-        g.add((INTRO.INT_Motif, SKOS.broadMatch, INTERTEXT_MT.Motive))
-    
-    # intro:INT_Topic
-    if any(g.triples((None, RDF.type, INTRO.INT_Topic))):
-        g.add((MIMOTEXT.Q20, SKOS.closeMatch, INTRO.INT_Topic)) # thematic concept
-    
-    ## Properties ##
-    
-    # ecrm:P1_is_identified_by
-    if any(g.triples((None, ECRM.P1_is_identified_by, None))):
-        g.add((DC.identifier, SKOS.closeMatch, ECRM.P1_is_identified_by))
-        g.add((URW.hasIdentifier, SKOS.closeMatch, ECRM.P1_is_identified_by))
-
-    # ecrm:P2_has_type
-    if any(g.triples((None, ECRM.P2_has_type, None))):
-        g.add((DC.type, SKOS.closeMatch, ECRM.P2_has_type))
-        g.add((DRACOR.has_genre, SKOS.broadMatch, ECRM.P2_has_type))
-        g.add((FOAF.gender, SKOS.broadMatch, ECRM.P2_has_type))
-        g.add((MIMOTEXT.P12, SKOS.broadMatch, ECRM.P2_has_type)) # genre
-        g.add((POSTDATA_CORE.gender, SKOS.broadMatch, ECRM.P2_has_type))
-        g.add((POSTDATA_CORE.genre, SKOS.broadMatch, ECRM.P2_has_type))
-        g.add((SCHEMA.genre, SKOS.broadMatch, ECRM.P2_has_type))
-        g.add((URW.gender, SKOS.broadMatch, ECRM.P2_has_type))
-    
-    # ecrm:P4_has_time-span
-    if any(g.triples((None, ECRM["P4_has_time-span"], None))):
-        g.add((DC.date, SKOS.closeMatch, ECRM["P4_has_time-span"]))
-        g.add((DC.created, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((DC.dateCopyrighted, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((DRACOR.printYear, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((DRACOR.writtenYear, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((MIMOTEXT.P9, SKOS.broadMatch, ECRM["P4_has_time-span"])) # publication date
-        g.add((POSTDATA_CORE.date, SKOS.closeMatch, ECRM["P4_has_time-span"]))
-        g.add((POSTDATA_CORE.birthDate, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((POSTDATA_CORE.deathDate, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((SCHEMA.dateCreated, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((SCHEMA.datePublished, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((URW.wasPublishedWhen, SKOS.broadMatch, ECRM["P4_has_time-span"]))
-        g.add((URB.date, SKOS.closeMatch, ECRM["P4_has_time-span"]))
-    
-    # ecrm:P7_took_place_at
-    if any(g.triples((None, ECRM.P7_took_place_at, None))):
-        g.add((FABIO.hasPlaceOfPublication, SKOS.broadMatch, ECRM.P7_took_place_at))
-        g.add((MIMOTEXT.P10, SKOS.broadMatch, ECRM.P7_took_place_at)) # publication place
-        g.add((POSTDATA_CORE.birthPlace, SKOS.broadMatch, ECRM.P7_took_place_at))
-        g.add((POSTDATA_CORE.deathPlace, SKOS.broadMatch, ECRM.P7_took_place_at))
-        g.add((SCHEMA.locationCreated, SKOS.broadMatch, ECRM.P7_took_place_at))
-        g.add((URW.wasPublishedWhere, SKOS.broadMatch, ECRM.P7_took_place_at))
-
-    # ecrm:P7i_witnessed
-    if any(g.triples((None, ECRM.P7i_witnessed, None))):
-        g.add((POSTDATA_CORE.birthPlaceOf, SKOS.broadMatch, ECRM.P7i_witnessed))
-        g.add((POSTDATA_CORE.deathPlaceOf, SKOS.broadMatch, ECRM.P7i_witnessed))
-    
-    # ecrm:P14_carried_out_by
-    if any(g.triples((None, ECRM.P14_carried_out_by, None))):
-        g.add((BIBO.editor, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((DRACOR.has_author, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((FOAF.maker, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((MIMOTEXT.P5, SKOS.broadMatch, ECRM.P14_carried_out_by)) # has author
-        g.add((POSTDATA_CORE.hasCreator, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((POSTDATA_CORE.hasEditor, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((SCHEMA.author, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((SCHEMA.creator, SKOS.broadMatch, ECRM.P14_carried_out_by))
-        g.add((URW.wasPublishedBy, SKOS.broadMatch, ECRM.P14_carried_out_by))
-
-    # ecrm:P14i_performed
-    if any(g.triples((None, ECRM.P14i_performed, None))):
-        g.add((DC.creator, SKOS.broadMatch, ECRM.P14i_performed))
-        g.add((DC.publisher, SKOS.broadMatch, ECRM.P14i_performed))
-        g.add((FOAF.made, SKOS.broadMatch, ECRM.P14i_performed))
-        g.add((MIMOTEXT.P7, SKOS.broadMatch, ECRM.P14i_performed)) # author of
-        g.add((POSTDATA_CORE.isCreatorOf, SKOS.broadMatch, ECRM.P14i_performed))
-        g.add((POSTDATA_CORE.editorOf, SKOS.broadMatch, ECRM.P14i_performed))
-        
-    # ecrm:P102_has_title
-    if any(g.triples((None, ECRM.P102_has_title, None))):
-        g.add((DC.title, SKOS.closeMatch, ECRM.P102_has_title))
-        g.add((MIMOTEXT.P4, SKOS.closeMatch, ECRM.P102_has_title))  # title
-    
-    # ecrm:P131_is_identified_by
-    if any(g.triples((None, ECRM.P131_is_identified_by, None))):
-        g.add((FOAF.name, SKOS.closeMatch, ECRM.P131_is_identified_by))
-        g.add((MIMOTEXT.P8, SKOS.closeMatch, ECRM.P131_is_identified_by))  # name
-    
-    # ecrm:P138i_has_representation
-    if any(g.triples((None, ECRM.P138i_has_representation, None))):
-        g.add((FOAF.img, SKOS.broadMatch, ECRM.P138i_has_representation))
-        g.add((MIMOTEXT.P21, SKOS.broadMatch, ECRM.P138i_has_representation)) # full work available at URL
-    
-    # lrmoo:R3_realises
-    if any(g.triples((None, LRMOO.R3_realises, None))):
-        g.add((URB.realization, SKOS.closeMatch, LRMOO.R3_realises))
+    # Index the graph in a single pass: present types/predicates for the alignment probes,
+    # plus the expression -> actualization -> feature/reference paths used by the complex properties
+    types_present = set()
+    preds_present = set()
+    expressions = []
+    topics = set()
+    characters = set()
+    persons = set()
+    places = set()
+    expr2acts = defaultdict(list)
+    act2exprs = defaultdict(set)
+    act2feat = {}
+    act2refs = defaultdict(list)
+    tp2expr = {}
+    expr2mani = defaultdict(list)
+    mani2item = defaultdict(list)
+    for s, p, o in g:
+        preds_present.add(p)
+        if p == RDF.type:
+            types_present.add(o)
+            if o == LRMOO.F2_Expression:
+                expressions.append(s)
+            elif o == INTRO.INT_Topic:
+                topics.add(s)
+            elif o == INTRO.INT_Character:
+                characters.add(s)
+            elif o == ECRM.E21_Person:
+                persons.add(s)
+            elif o == ECRM.E53_Place:
+                places.add(s)
+        elif p == INTRO.R18_showsActualization:
+            expr2acts[s].append(o)
+            act2exprs[o].add(s)
+        elif p == INTRO.R17_actualizesFeature:
+            act2feat.setdefault(s, o)
+        elif p == ECRM.P67_refers_to:
+            act2refs[s].append(o)
+        elif p == INTRO.R30i_isTextPassageOf:
+            tp2expr.setdefault(s, o)
+        elif p == LRMOO.R4i_is_embodied_in:
+            expr2mani[s].append(o)
+        elif p == LRMOO.R7i_is_exemplified_by:
+            mani2item[s].append(o)
+
+    g.addN((s, p, o, g)
+           for cls, triples in CLASS_ALIGN.items() if cls in types_present
+           for s, p, o in triples)
+    g.addN((s, p, o, g)
+           for prop, triples in PROP_ALIGN.items() if prop in preds_present
+           for s, p, o in triples)
+
+    ## Complex Properties ##
+
+    # Generated triples are collected and written in one addN at the end; nothing below reads them back
+    buf = []
 
-    # lrmoo:R3_is_realised_in
-    if any(g.triples((None, LRMOO.R3_is_realised_in, None))):
-        g.add((URB.realizationOf, SKOS.closeMatch, LRMOO.R3_is_realised_in))
-    
-    # lrmoo:R4_embodies
-    if any(g.triples((None, LRMOO.R4_embodies, None))):
-        g.add((URB.embodimentOf, SKOS.closeMatch, LRMOO.R4_embodies))
+    # new properties for F1->F3 (hasManifestation), F1->F5 (hasPortrayal) and F2->F5 (hasRepresentation)
+    if LRMOO.F1_Work in types_present and LRMOO.F3_Manifestation in types_present:
+        define_property(buf, SAPPHO_PROP.has_manifestation, **PROPERTY_DEFS[SAPPHO_PROP.has_manifestation])
+        buf.append((POSTDATA_CORE.isRealisedThrough, OWL.inverseOf, POSTDATA_CORE.realises))
 
-    # lrmoo:R4i_is_embodied_in
-    if any(g.triples((None, LRMOO.R4i_is_embodied_in, None))):
-        g.add((URB.embodiment, SKOS.closeMatch, LRMOO.R4i_is_embodied_in))
-    
-    # intro:R12i_isReferredToEntity
-    if any(g.triples((None, INTRO.R12i_isReferredToEntity, None))):
-        g.add((INTRO.R12i_isReferredToEntity, SKOS.closeMatch, INTERTEXT_AB.there))
-    
-    # intro:R13i_isReferringEntity
-    if any(g.triples((None, INTRO.R13i_isReferringEntity, None))):
-        g.add((INTRO.R13i_isReferringEntity, SKOS.closeMatch, INTERTEXT_AB.here))
+        buf.extend(manifestation_links(g, expr2mani))
+  
+    if LRMOO.F1_Work in types_present and LRMOO.F5_Item in types_present:
+        define_property(buf, SAPPHO_PROP.has_portrayal, **PROPERTY_DEFS[SAPPHO_PROP.has_portrayal])
 
-    # intro:R19i_isTypeOf
-    if any(g.triples((None, INTRO.R19i_isTypeOf, None))):
-        g.add((INTERTEXT_AB.specifiedBy, SKOS.broadMatch, INTRO.R19i_isTypeOf))
-        g.add((POSTDATA_ANALYSIS.typeOfIntertextuality, SKOS.broadMatch, INTRO.R19i_isTypeOf))
-    
-    # intro:R22i_relationIsBasedOnSimilarity
-    if any(g.triples((None, INTRO.R22i_relationIsBasedOnSimilarity, None))):
-        g.add((INTRO.R22i_relationIsBasedOnSimilarity, SKOS.broadMatch, INTERTEXT_AB.mediatedBy))
-    
-    # intro:R24_hasRelatedEntity
-    if any(g.triples((None, INTRO.R24_hasRelatedEntity, None))):
-        g.add((INTRO.R24_hasRelatedEntity, SKOS.broadMatch, INTERTEXT_AB.mediatedBy))
-    
-    # intro:R30_hasTextPassage
-    if any(g.triples((None, INTRO.R30_hasTextPassage, None))):
-        g.add((INTRO.R30_hasTextPassage, SKOS.broadMatch, DC.hasPart))
-        g.add((POSTDATA_CORE.hasTextUnit, SKOS.narrowMatch, INTRO.R30_hasTextPassage))
-    
-    # prov:wasDerivedFrom
-    if any(g.triples((None, PROV.wasDerivedFrom, None))):
-        g.add((DC.source, SKOS.closeMatch, PROV.wasDerivedFrom))
-        g.add((MIMOTEXT.P17, SKOS.broadMatch, PROV.wasDerivedFrom)) # reference URL
+        buf.extend(portrayal_links(g, expr2mani, mani2item))
 
-    ## Complex Properties ##    
+    if LRMOO.F2_Expression in types_present and LRMOO.F5_Item in types_present:
+        define_property(buf, SAPPHO_PROP.has_representation, **PROPERTY_DEFS[SAPPHO_PROP.has_representation])
 
-    # new properties for F1->F3 (hasManifestation), F1->F5 (hasPortrayal) and F2->F5 (hasRepresentation)
-    if (
-        any(g.triples((None, RDF.type, LRMOO.F1_Work))) and
-        any(g.triples((None, RDF.type, LRMOO.F3_Manifestation)))
-    ):
-        g.add((SAPPHO_PROP.has_manifestation, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.has_manifestation, RDFS.label, 
-            Literal("has_manifestation", lang="en")))
-        g.add((SAPPHO_PROP.has_manifestation, RDFS.comment, Literal("A F1_Work has a F3_Manifestation.", lang="en")))
-        g.add((SAPPHO_PROP.has_manifestation, SKOS.closeMatch, FABIO.hasManifestation))
-        g.add((SAPPHO_PROP.has_manifestation, SKOS.closeMatch, POSTDATA_CORE.isRealisedThrough))
-        g.add((POSTDATA_CORE.isRealisedThrough, OWL.inverseOf, POSTDATA_CORE.realises))
-        g.add((SAPPHO_PROP.has_manifestation, SKOS.closeMatch, URB.manifestation))
-        g.add((SAPPHO_PROP.has_manifestation, RDFS.domain, LRMOO.F1_Work))
-        g.add((SAPPHO_PROP.has_manifestation, RDFS.range,  LRMOO.F3_Manifestation))
-
-        bnode = BNode()
-        Collection(g, bnode, [
-            LRMOO.R3_is_realised_in,
-            LRMOO.R4i_is_embodied_in
-        ])
-        g.add((SAPPHO_PROP.has_manifestation, OWL.propertyChainAxiom, bnode))
-        
-        for work in g.subjects(RDF.type, LRMOO.F1_Work):
-            for expr in g.objects(work, LRMOO.R3_is_realised_in):
-                for mani in g.objects(expr, LRMOO.R4i_is_embodied_in):
-                    g.add((work, SAPPHO_PROP.has_manifestation, mani))
-  
-    if (
-        any(g.triples((None, RDF.type, LRMOO.F1_Work))) and
-        any(g.triples((None, RDF.type, LRMOO.F5_Item)))
-    ):
-        g.add((SAPPHO_PROP.has_portrayal, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.has_portrayal, RDFS.label, 
-            Literal("has_portrayal", lang="en")))
-        g.add((SAPPHO_PROP.has_portrayal, RDFS.comment, 
-            Literal("A F1_Work has a F5_Item.", lang="en")))
-        g.add((SAPPHO_PROP.has_portrayal, SKOS.closeMatch, FABIO.hasPortrayal))
-        g.add((SAPPHO_PROP.has_portrayal, RDFS.domain, LRMOO.F1_Work))
-        g.add((SAPPHO_PROP.has_portrayal, RDFS.range,  LRMOO.F5_Item))
-
-        bnode = BNode()
-        Collection(g, bnode, [
-            LRMOO.R3_is_realised_in,
-            LRMOO.R4i_is_embodied_in,
-            LRMOO.R7i_is_exemplified_by
-        ])
-        g.add((SAPPHO_PROP.has_portrayal, OWL.propertyChainAxiom, bnode))
-        
-        for work in g.subjects(RDF.type, LRMOO.F1_Work):
-            for expr in g.objects(work, LRMOO.R3_is_realised_in):
-                for mani in g.objects(expr, LRMOO.R4i_is_embodied_in):
-                    for item in g.objects(mani, LRMOO.R7i_is_exemplified_by):
-                        g.add((work, SAPPHO_PROP.has_portrayal, item))
-
-    if (
-        any(g.triples((None, RDF.type, LRMOO.F2_Expression))) and
-        any(g.triples((None, RDF.type, LRMOO.F5_Item)))
-    ):
-        g.add((SAPPHO_PROP.has_representation, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.has_representation, RDFS.label, 
-            Literal("has_representation", lang="en")))
-        g.add((SAPPHO_PROP.has_representation, RDFS.comment, 
-            Literal("A F2_Expression has a F5_Item.", lang="en")))
-        g.add((SAPPHO_PROP.has_representation, SKOS.closeMatch, FABIO.hasRepresentation))
-        g.add((SAPPHO_PROP.has_representation, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.has_representation, RDFS.range,  LRMOO.F5_Item))
-
-        bnode = BNode()
-        Collection(g, bnode, [
-            LRMOO.R4i_is_embodied_in,
-            LRMOO.R7i_is_exemplified_by
-        ])
-        g.add((SAPPHO_PROP.has_representation, OWL.propertyChainAxiom, bnode))
-        
-        for expr in g.subjects(RDF.type, LRMOO.F2_Expression):
-                for mani in g.objects(expr, LRMOO.R4i_is_embodied_in):
-                    for item in g.objects(mani, LRMOO.R7i_is_exemplified_by):
-                        g.add((expr, SAPPHO_PROP.has_representation, item))
+        buf.extend(representation_links(expressions, expr2mani, mani2item))
     
     # sappho_prop:about: expressions that actualize a intro:INT_Topic will be also linked to the topic
     
     # Gather directions (younger/older) first, needed later as well
     directions = []
+
+    # An expression can take part in many relations; look its year up only once
+    year_cache = {}
+    def creation_year(expr):
+        y = year_cache.get(expr, _MISSING)
+        if y is _MISSING:
+            y = year_cache[expr] = get_creation_year(g, expr)
+        return y
     
     for rel in g.subjects(RDF.type, INTRO.INT31_IntertextualRelation):
         tp_expr = []
         for tp in g.objects(rel, INTRO.R24_hasRelatedEntity):
-            expr = g.value(tp, INTRO.R30i_isTextPassageOf)
+            expr = tp2expr.get(tp)
             if expr:
                 tp_expr.append((tp, expr))
 
@@ -678,8 +1051,8 @@ def main(argv=None):
                 
         (tp1, expr1), (tp2, expr2) = tp_expr[:2]
             
-        y1 = get_creation_year(g, expr1)
-        y2 = get_creation_year(g, expr2)
+        y1 = creation_year(expr1)
+        y2 = creation_year(expr2)
         
         if y1 is None or y2 is None:
             continue
@@ -691,317 +1064,121 @@ def main(argv=None):
             older_expr, younger_expr = expr2, expr1
             older_tp,    younger_tp    = tp2,    tp1
 
-        directions.append((younger_expr, older_expr, younger_tp, older_tp))
+        directions.append((rel, younger_expr, older_expr, younger_tp, older_tp))
 
-    if any(g.triples((None, RDF.type, INTRO.INT_Topic))):
-        g.add((SAPPHO_PROP.about, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.about, RDFS.label,
-            Literal("about", lang="en")))
-        g.add((SAPPHO_PROP.about, RDFS.comment,
-            Literal("Link from a F2_Expression to an INT_Topic.", lang="en")))
-            
-        b_about = BNode()
-        Collection(g, b_about, [
-            INTRO.R18_showsActualization,
-            INTRO.R17_actualizesFeature
-        ])
-        g.add((SAPPHO_PROP.about, OWL.propertyChainAxiom, b_about))
-        g.add((SAPPHO_PROP.about, SKOS.closeMatch, DC.subject))
-        g.add((SAPPHO_PROP.about, SKOS.closeMatch, FOAF.topic))
-        g.add((SAPPHO_PROP.about, SKOS.closeMatch, MIMOTEXT.P36)) # about
-        g.add((SAPPHO_PROP.about, SKOS.closeMatch, SCHEMA.about))
-        g.add((SAPPHO_PROP.about, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.about, RDFS.range, INTRO.INT_Topic))
-
-        for expr in g.subjects(RDF.type, LRMOO.F2_Expression):
-            for act in g.objects(expr, INTRO.R18_showsActualization):
-                topic = g.value(act, INTRO.R17_actualizesFeature)
-                if topic and (topic, RDF.type, INTRO.INT_Topic) in g:
-                    g.add((expr, SAPPHO_PROP.about, topic))
+    if INTRO.INT_Topic in types_present:
+        define_property(buf, SAPPHO_PROP.about, **PROPERTY_DEFS[SAPPHO_PROP.about])
+
+        buf.extend(topic_links(expressions, expr2acts, act2feat, topics))
 
     # sappho_prop:expr_relation: expressions that are linked via intro:INT31 will be linked via this property
-    if any(g.triples((None, RDF.type, INTRO.INT31_IntertextualRelation))):
-        g.add((SAPPHO_PROP.expr_relation, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.expr_relation, RDFS.label,
-            Literal("expr_relation", lang="en")))
-        g.add((SAPPHO_PROP.expr_relation, RDFS.comment,
-            Literal("A relation between two F2_Expressions.", lang="en")))
-
-        first_elem = BNode()
-        g.add((first_elem, OWL.inverseOf, INTRO.R18i_actualizationFoundOn))
-        chain_list = [
-            first_elem,
-            INTRO.R24i_isRelatedEntity,
-            INTRO.R24_hasRelatedEntity,
-            INTRO.R18i_actualizationFoundOn
-        ]
-        chain_bnode = BNode()
-        Collection(g, chain_bnode, chain_list)
-        g.add((SAPPHO_PROP.expr_relation, OWL.propertyChainAxiom, chain_bnode))
-        g.add((SAPPHO_PROP.expr_relation, RDF.type, OWL.SymmetricProperty))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.closeMatch, DC.relation))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.closeMatch, MIMOTEXT.P34))  # relation
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.hasDerivedWork))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.isDerivedFrom))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.closeMatch, POSTDATA_ANALYSIS.hasRelationsWith))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.closeMatch, POSTDATA_ANALYSIS.isRelatedWith))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.isRelatedContemporaneouslyWith))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.hasContemporaryRelation))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.usesAsSource))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, POSTDATA_ANALYSIS.isSource))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, URW.influenced))
-        g.add((SAPPHO_PROP.expr_relation, SKOS.narrowMatch, URW.influencedBy))
-        g.add((SAPPHO_PROP.expr_relation, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.expr_relation, RDFS.range,  LRMOO.F2_Expression))
-        
+    if INTRO.INT31_IntertextualRelation in types_present:
+        define_property(buf, SAPPHO_PROP.expr_relation, **PROPERTY_DEFS[SAPPHO_PROP.expr_relation])
+
         # add directions to intro:INT31_IntertextualRelation
-        for rel in g.subjects(RDF.type, INTRO.INT31_IntertextualRelation):
-            acts = list(g.objects(rel, INTRO.R24_hasRelatedEntity))
-            exprs = {
-                expr
-                for act in acts
-                for expr in g.subjects(INTRO.R18_showsActualization, act)
-            }
-            for e1 in exprs:
-                for e2 in exprs:
-                    if e1 != e2:
-                        g.add((e1, SAPPHO_PROP.expr_relation, e2))
-                        g.add((e2, SAPPHO_PROP.expr_relation, e1))
+        buf.extend(relation_links(g, act2exprs))
 
         # Also materialize younger/older hints if computed
-        for younger_expr, older_expr, younger_tp, older_tp in directions:
-            g.add((URIRef(str(rel)), INTRO.R13_hasReferringEntity, younger_expr))
-            g.add((younger_expr, INTRO.R13i_isReferringEntity, URIRef(str(rel))))
-            g.add((URIRef(str(rel)), INTRO.R12_hasReferredToEntity, older_expr))
-            g.add((older_expr, INTRO.R12i_isReferredToEntity, URIRef(str(rel))))
+        buf.extend(direction_links(directions))
 
     # sappho_prop:expr_possibly_cites / sappho_prop:expr_possibly_cited_by
     # if two expressions have intro:INT21_TextPassages that are part of their intro:INT31, 
     # it is possible (but not necessary) that the younger text cites the older text. 
     # To find out which one is which, the time-spans of the expression or manifestation creations are compared.
 
-    if any(g.triples((None, INTRO.R30i_isTextPassageOf, None))):
-
-        g.add((SAPPHO_PROP.expr_possibly_cites, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.expr_possibly_cites, RDFS.label,
-            Literal("expr_possibly_cites", lang="en")))
-        g.add((SAPPHO_PROP.expr_possibly_cites, RDFS.comment,
-            Literal("A F2_Expression possibly cites a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.expr_possibly_cites, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.expr_possibly_cites, RDFS.range, LRMOO.F2_Expression))
+    if INTRO.R30i_isTextPassageOf in preds_present:
 
-        inv_rel = BNode(); g.add((inv_rel, OWL.inverseOf, INTRO.R24_hasRelatedEntity))
-        inv_tp  = BNode()
-        g.add((inv_tp, OWL.inverseOf, INTRO.R30i_isTextPassageOf))
+        for prop in (SAPPHO_PROP.expr_possibly_cites, SAPPHO_PROP.expr_possibly_cited_by):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
 
-        chain_nodes = [
-            INTRO.R30_hasTextPassage, 
-            inv_rel,                 
-            INTRO.R24_hasRelatedEntity,
-            inv_tp                 
-    ]
-        chain_bnode = BNode(); Collection(g, chain_bnode, chain_nodes)
-        
-        g.add((SAPPHO_PROP.expr_possibly_cites, OWL.propertyChainAxiom, chain_bnode))
-
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, RDFS.label, Literal("expr_possibly_cited_by", lang="en")))
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, RDFS.comment, Literal("A F2_Expression is possibly cited by a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, OWL.inverseOf,
-            SAPPHO_PROP.expr_possibly_cites))
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.expr_possibly_cited_by, RDFS.range, LRMOO.F2_Expression))
-        
         # lrmoo alignment
-        g.add((LRMOO.R76_is_derivative_of, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
-        g.add((LRMOO.R76i_has_derivative, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
+        buf.append((LRMOO.R76_is_derivative_of, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
+        buf.append((LRMOO.R76i_has_derivative, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
 
         # other ontologies
-        g.add((BIBO.cites, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
-        g.add((BIBO.citedBy, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
+        buf.append((BIBO.cites, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
+        buf.append((BIBO.citedBy, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
         
-        g.add((CITO.cites, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
-        g.add((CITO.isCitedBy, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
+        buf.append((CITO.cites, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
+        buf.append((CITO.isCitedBy, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cited_by))
                 
-        g.add((SCHEMA.citation, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
+        buf.append((SCHEMA.citation, SKOS.broadMatch, SAPPHO_PROP.expr_possibly_cites))
         
         # sappho_prop:tp_possibly_cites / sappho_prop:tp_possibly_cited_by
         # if two expressions have intro:INT21_TextPassages that are part of their intro:INT31, 
         # it is also possible (but not necessary) that the younger text cites the text passage of the older text. 
                             
-        g.add((SAPPHO_PROP.tp_possibly_cites, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.tp_possibly_cites, RDFS.label,
-            Literal("tp_possibly_cites", lang="en")))
-        g.add((SAPPHO_PROP.tp_possibly_cites, RDFS.comment,
-            Literal("A F2_Expression possibly cites an INT21_TextPassage.", lang="en")))
-        g.add((SAPPHO_PROP.tp_possibly_cites, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.tp_possibly_cites, RDFS.range, INTRO.INT21_TextPassage))
-        
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, RDFS.label,
-            Literal("tp_possibly_cited_by", lang="en")))
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, RDFS.comment,
-            Literal("An INT21_TextPassage is possibly cited by a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, RDFS.domain, INTRO.INT21_TextPassage))
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, RDFS.range, LRMOO.F2_Expression))
-        
-        g.add((SAPPHO_PROP.tp_possibly_cited_by, OWL.inverseOf, SAPPHO_PROP.tp_possibly_cites))
-        
-        g.add((LRMOO.R75_incorporates,  SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cites))
-        g.add((LRMOO.R75i_is_incorporated_in, SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cited_by))
-        
-        chain21 = [INTRO.R30_hasTextPassage]
-        b21     = BNode()
-        Collection(g, b21, chain21)
-        g.add((SAPPHO_PROP.tp_possibly_cites, OWL.propertyChainAxiom, b21))
+        for prop in (SAPPHO_PROP.tp_possibly_cites, SAPPHO_PROP.tp_possibly_cited_by):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
 
-        for younger_expr, older_expr, younger_tp, older_tp in directions:
-            
-            g.add((younger_expr, SAPPHO_PROP.expr_possibly_cites, older_expr))
-            g.add((older_expr,   SAPPHO_PROP.expr_possibly_cited_by, younger_expr))
-            
-            g.add((younger_expr, SAPPHO_PROP.tp_possibly_cites, older_tp))
-            g.add((older_tp,   SAPPHO_PROP.tp_possibly_cited_by, younger_expr))
+        buf.append((LRMOO.R75_incorporates,  SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cites))
+        buf.append((LRMOO.R75i_is_incorporated_in, SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cited_by))
 
-        g.add((CITO.hasCitedEntity,  SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cites))
-        g.add((CITO.hasCitingEntity, SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cited_by))
+        buf.extend(citation_links(directions))
+
+        buf.append((CITO.hasCitedEntity,  SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cites))
+        buf.append((CITO.hasCitingEntity, SKOS.broadMatch, SAPPHO_PROP.tp_possibly_cited_by))
     
     # sappho_prop:expr_references / sappho_prop:referenced_by_expr: expressions that actualize a intro:INT18_Reference will be also linked to the referred entity
-    if any(g.triples((None, ECRM.P67_refers_to, None))):
-        g.add((SAPPHO_PROP.expr_references, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.expr_references, RDFS.label,
-            Literal("expr_references", lang="en")))
-        g.add((SAPPHO_PROP.expr_references, RDFS.comment,
-            Literal("A F2_Expression references an E21_Person, an E53_Place or a F2_Expression.", lang="en")))
-        chain_bnode = BNode()
-        Collection(g, chain_bnode, [
-            INTRO.R18_showsActualization,
-            ECRM.P67_refers_to
-        ])
-        g.add((SAPPHO_PROP.expr_references, OWL.propertyChainAxiom, chain_bnode))
-        
-        g.add((SAPPHO_PROP.expr_references, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.expr_references, RDFS.range, ECRM.E21_Person))
-        g.add((SAPPHO_PROP.expr_references, RDFS.range, ECRM.E53_Place))
-        g.add((SAPPHO_PROP.expr_references, RDFS.range, LRMOO.F2_Expression))
-        
-        g.add((SAPPHO_PROP.referenced_by_expr, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.label,
-            Literal("referenced_by_expr", lang="en")))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.comment,
-            Literal("An E21_Person, an E53_Place or a F2_Expression is referenced by a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.referenced_by_expr, OWL.inverseOf, SAPPHO_PROP.expr_references))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.domain, ECRM.E21_Person))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.domain, ECRM.E53_Place))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.referenced_by_expr, RDFS.range,  LRMOO.F2_Expression))
-        
-        for expr in g.subjects(RDF.type, LRMOO.F2_Expression):
-            for act in g.objects(expr, INTRO.R18_showsActualization):
-                for target in g.objects(act, ECRM.P67_refers_to):
-                    g.add((expr, SAPPHO_PROP.expr_references, target))
-                    if (target, RDF.type, ECRM.E21_Person) in g:
-                        g.add((expr, SAPPHO_PROP.references_person, target))
-                    elif (target, RDF.type, ECRM.E53_Place) in g:
-                        g.add((expr, SAPPHO_PROP.references_place, target))
-                    elif (target, RDF.type, LRMOO.F2_Expression) in g:
-                        pass
-        
-        g.add((SAPPHO_PROP.expr_references, SKOS.closeMatch, DC.references))
-        g.add((DC.isReferencedBy, OWL.inverseOf, DC.references))
-        g.add((SAPPHO_PROP.expr_references, SKOS.closeMatch, POSTDATA_ANALYSIS.reference))
+    if ECRM.P67_refers_to in preds_present:
+        for prop in (SAPPHO_PROP.expr_references, SAPPHO_PROP.referenced_by_expr):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
+
+        buf.extend(reference_links(expressions, expr2acts, act2refs, persons, places))
         
-        g.add((SAPPHO_PROP.expr_references, SKOS.narrowMatch, MIMOTEXT.P50)) # mentions
-        g.add((MIMOTEXT.P51, OWL.inverseOf, MIMOTEXT.P50))
+        buf.append((DC.isReferencedBy, OWL.inverseOf, DC.references))
+        buf.append((MIMOTEXT.P51, OWL.inverseOf, MIMOTEXT.P50))
 
-        g.add((POSTDATA_CORE.mentions, SKOS.broadMatch, SAPPHO_PROP.expr_references))
-        g.add((POSTDATA_CORE.isMentionedIn, OWL.inverseOf, POSTDATA_CORE.mentions))
+        buf.append((POSTDATA_CORE.mentions, SKOS.broadMatch, SAPPHO_PROP.expr_references))
+        buf.append((POSTDATA_CORE.isMentionedIn, OWL.inverseOf, POSTDATA_CORE.mentions))
         
-        g.add((SCHEMA.mentions, SKOS.broadMatch, SAPPHO_PROP.expr_references))
-
-    if any(g.triples((None, ECRM.P67_refers_to, ECRM.E21_Person))):
-        g.add((SAPPHO_PROP.references_person, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.references_person, RDFS.label, Literal("references_person", lang="en")))
-        g.add((SAPPHO_PROP.references_person, RDFS.comment, Literal("A F2_Expression references an E21_Person.", lang="en")))
-        chain_bnode = BNode()
-        Collection(g, chain_bnode, [INTRO.R18_showsActualization, ECRM.P67_refers_to])
-        g.add((SAPPHO_PROP.references_person, OWL.propertyChainAxiom, chain_bnode))
-        g.add((SAPPHO_PROP.references_person, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.references_person, RDFS.range, ECRM.E21_Person))
-
-        g.add((SAPPHO_PROP.person_referenced_by, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.person_referenced_by, RDFS.label, Literal("person_referenced_by", lang="en")))
-        g.add((SAPPHO_PROP.person_referenced_by, RDFS.comment, Literal("An E21_Person is referenced by a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.person_referenced_by, OWL.inverseOf, SAPPHO_PROP.references_person))
-        g.add((SAPPHO_PROP.person_referenced_by, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.person_referenced_by, RDFS.range, ECRM.E21_Person))
-
-        g.add((POSTDATA_ANALYSIS.refersTo, SKOS.broadMatch, SAPPHO_PROP.references_person))
-        g.add((POSTDATA_ANALYSIS.isReferredToBy, OWL.inverseOf, POSTDATA_ANALYSIS.refersTo))
-
-    if any(g.triples((None, ECRM.P67_refers_to, ECRM.E53_Place))):
-        g.add((SAPPHO_PROP.references_place, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.references_place, RDFS.label, Literal("references_place", lang="en")))
-        g.add((SAPPHO_PROP.references_place, RDFS.comment, Literal("A F2_Expression references an E53_Place.", lang="en")))
-        chain_bnode = BNode()
-        Collection(g, chain_bnode, [INTRO.R18_showsActualization, ECRM.P67_refers_to])
-        g.add((SAPPHO_PROP.references_place, OWL.propertyChainAxiom, chain_bnode))
-        g.add((SAPPHO_PROP.references_place, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.references_place, RDFS.range, ECRM.E53_Place))
-
-        g.add((SAPPHO_PROP.place_referenced_by, RDF.type, OWL.ObjectProperty))
-        g.add((SAPPHO_PROP.place_referenced_by, RDFS.label, Literal("place_referenced_by", lang="en")))
-        g.add((SAPPHO_PROP.place_referenced_by, RDFS.comment, Literal("An E53_Place is referenced by a F2_Expression.", lang="en")))
-        g.add((SAPPHO_PROP.place_referenced_by, OWL.inverseOf, SAPPHO_PROP.references_place))
-        g.add((SAPPHO_PROP.place_referenced_by, RDFS.domain, LRMOO.F2_Expression))
-        g.add((SAPPHO_PROP.place_referenced_by, RDFS.range, ECRM.E53_Place))
-
-        g.add((POSTDATA_ANALYSIS.refersTo, SKOS.broadMatch, SAPPHO_PROP.references_place))
-        g.add((POSTDATA_ANALYSIS.refersTo, OWL.inverseOf, POSTDATA_ANALYSIS.refersTo))
+        buf.append((SCHEMA.mentions, SKOS.broadMatch, SAPPHO_PROP.expr_references))
 
-    # sappho_prop:has_character / sappho_prop:is_character_in: link character and expression
-    if any(g.triples((None, RDF.type, INTRO.INT_Character))):
-        properties = [
-            ("has_character",    GOLEM.GP1i_has_character),
-            ("is_character_in",  GOLEM.GP1i_is_character_in),
-        ]
+    # Entities referred to via P67, checked against the typed persons/places
+    # (P67 points at instances, never at the E21/E53 class IRIs)
+    referenced = {t for refs in act2refs.values() for t in refs}
 
-        for local_name, golem_prop in properties:
-            prop = SAPPHO_PROP[local_name]
-            g.add((prop, RDF.type, OWL.ObjectProperty))
-            g.add((prop, RDFS.label, Literal(local_name, lang="en")))
-            g.add((prop, SKOS.closeMatch, golem_prop))
-
-            if local_name == "has_character":
-                g.add((prop, RDFS.domain, LRMOO.F2_Expression))
-                g.add((prop, RDFS.range,  INTRO.INT2_ActualizationOfFeature))
-            else:
-                g.add((prop, RDFS.domain, INTRO.INT2_ActualizationOfFeature))
-                g.add((prop, RDFS.range,  LRMOO.F2_Expression))
-
-        for expr in g.subjects(RDF.type, LRMOO.F2_Expression):
-            for act in g.objects(expr, INTRO.R18_showsActualization):
-                feat = g.value(act, INTRO.R17_actualizesFeature)
-                if feat and (feat, RDF.type, INTRO.INT_Character) in g:
-                    g.add((expr, SAPPHO_PROP.has_character,    act))
-                    g.add((act,  SAPPHO_PROP.is_character_in, expr))
-        
-        g.add((POSTDATA_CORE.characterIn, SKOS.closeMatch, SAPPHO_PROP.is_character_in))
-        g.add((POSTDATA_CORE.hasCharacter, SKOS.closeMatch, SAPPHO_PROP.has_character))
-        g.add((SCHEMA.character, SKOS.closeMatch, SAPPHO_PROP.has_character))
-    
-    # Serialize
-    g.serialize(destination=str(args.output), format="turtle")
+    if not persons.isdisjoint(referenced):
+        for prop in (SAPPHO_PROP.references_person, SAPPHO_PROP.person_referenced_by):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
 
-    # Remove DBpedia prefixes in-place
-    ttl_path = Path(args.output)
-    text = ttl_path.read_text(encoding="utf-8")
+        buf.append((POSTDATA_ANALYSIS.refersTo, SKOS.broadMatch, SAPPHO_PROP.references_person))
+        buf.append((POSTDATA_ANALYSIS.isReferredToBy, OWL.inverseOf, POSTDATA_ANALYSIS.refersTo))
 
-    text = re.sub(r'^@prefix\s+dbpedia:\s*<[^>]+>\s*\.\s*\n', '', text, flags=re.MULTILINE)
+    if not places.isdisjoint(referenced):
+        for prop in (SAPPHO_PROP.references_place, SAPPHO_PROP.place_referenced_by):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
 
-    text = re.sub(r'\bdbpedia:([A-Za-z0-9_/]+)\b', r'<https://dbpedia.org/\1>', text)
+        buf.append((POSTDATA_ANALYSIS.refersTo, SKOS.broadMatch, SAPPHO_PROP.references_place))
+        buf.append((POSTDATA_ANALYSIS.isReferredToBy, OWL.inverseOf, POSTDATA_ANALYSIS.refersTo))
 
-    ttl_path.write_text(text, encoding="utf-8")
+    # sappho_prop:has_character / sappho_prop:is_character_in: link character and expression
+    if INTRO.INT_Character in types_present:
+        for prop in (SAPPHO_PROP.has_character, SAPPHO_PROP.is_character_in):
+            define_property(buf, prop, **PROPERTY_DEFS[prop])
+
+        buf.extend(character_links(expressions, expr2acts, act2feat, characters))
+        
+        buf.append((POSTDATA_CORE.characterIn, SKOS.closeMatch, SAPPHO_PROP.is_character_in))
+        buf.append((POSTDATA_CORE.hasCharacter, SKOS.closeMatch, SAPPHO_PROP.has_character))
+        buf.append((SCHEMA.character, SKOS.closeMatch, SAPPHO_PROP.has_character))
+
+    g.addN((s, p, o, g) for s, p, o in buf)
+
+    # Serialize
+    if args.format == "nt":
+        # N-Triples has no prefixes, so the bindings below are not needed
+        with open(args.output, "wb", buffering=OUTPUT_BUFFER) as f:
+            g.serialize(destination=f, format="ox-nt" if oxrdflib is not None else "nt", encoding="utf-8")
+        print(f"✅ File saved as {args.output}")
+        return
+
+    for prefix, ns in BINDINGS:
+        g.namespace_manager.bind(prefix, ns, override=True)
+    # DBpedia IRIs are written in full, never as dbpedia:… qnames
+    g = without_prefixes(g, DBPEDIA_BASE)
+    with open(args.output, "wb", buffering=OUTPUT_BUFFER) as f:
+        g.serialize(destination=f, format="turtle", encoding="utf-8")
     print(f"✅ File saved as {args.output}")
 
 if __name__ == "__main__":
@@ -14,9 +14,11 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Iterable, List
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pyshacl import validate
 from wiki2crm import resources
 
@@ -24,11 +26,32 @@ from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL, XSD
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import oxrdflib  # registers the native ox-* serializers with rdflib
+except ImportError:
+    oxrdflib = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 # Settings
 SPARQL_ENDPOINT = "https://query.wikidata.org/sparql"
+WIKIDATA_API = "https://www.wikidata.org/w/api.php"
+LABEL_BATCH_SIZE = 50 # wbgetentities accepts at most 50 ids per call
 SESSION_USER_AGENT = "SapphoWorkIntegrationBot/1.0 (laura.untner@fu-berlin.de)"
 HTTP_TIMEOUT = 90
 MAX_RETRIES = 5
+OUTPUT_BUFFER = 1 << 20 # write buffer for the serialized output
+CACHE_EXPIRE = 7 * 24 * 3600 # seconds a cached Wikidata response stays valid (--cache)
+BATCH_SIZE = 100 # QIDs per VALUES query; the OPTIONAL/label-service query has to stay within WDQS's 60 s limit
+MAX_WORKERS = 4 # concurrent WDQS batches (WDQS allows 5 parallel queries per client)
 
 # Namespaces
 CRM = Namespace("http://www.cidoc-crm.org/cidoc-crm/") # CIDOC CRM
@@ -42,6 +65,18 @@ PROV = Namespace("http://www.w3.org/ns/prov#") # PROV-O - Provenance Ontology
 WD = "http://www.wikidata.org/entity/" # Base URI for Wikidata entities
 SAPPHO_BASE_URI = Namespace("https://sappho-digital.com/")
 
+# Terms with hyphens in their local name (not reachable via attribute access)
+ECRM_P4 = ECRM["P4_has_time-span"]
+ECRM_P4I = ECRM["P4i_is_time-span_of"]
+ECRM_E52 = ECRM["E52_Time-Span"]
+
+# Shared identifier and genre types
+WIKIDATA_ID_TYPE = URIRef("https://sappho-digital.com/id_type/wikidata")
+WIKIDATA_ID_LABEL = Literal("Wikidata ID", lang="en")
+WIKIDATA_ID_ITEM = URIRef("http://www.wikidata.org/wiki/Q43649390")
+GENRE_TYPE = URIRef(f"{SAPPHO_BASE_URI}genre_type/wikidata")
+GENRE_TYPE_LABEL = Literal("Wikidata Genre", lang="en")
+
 # HTTP helpers (Retry-After aware)
 def _parse_retry_after(header_val: str) -> Optional[float]:
     """
@@ -61,12 +96,21 @@ def _parse_retry_after(header_val: str) -> Optional[float]:
     except Exception:
         return None
 
-def make_session() -> requests.Session:
+def make_session(cache_path: Optional[Path] = None) -> requests.Session:
     """
     Build a pooled Session. Manual retry handling allows full respect of Retry-After.
+    With 'cache_path', responses are kept in an SQLite cache (requires requests-cache).
     """
-    sess = requests.Session()
-    sess.headers.update({"User-Agent": SESSION_USER_AGENT})
+    if cache_path is not None:
+        sess = requests_cache.CachedSession(
+            str(cache_path),
+            backend="sqlite",
+            expire_after=CACHE_EXPIRE,
+            allowable_methods=("GET", "POST"),
+        )
+    else:
+        sess = requests.Session()
+    sess.headers.update({"User-Agent": SESSION_USER_AGENT, "Accept-Encoding": "gzip, deflate"})
     retry = Retry(
         total=0,  # manual control below
         respect_retry_after_header=True,
@@ -130,15 +174,95 @@ def query_wikidata_raw(query: str, user_agent: str, timeout: int = HTTP_TIMEOUT)
     Execute a SPARQL query against Wikidata using the retry-aware HTTP routine.
     'user_agent' allows mirroring the original per-call UA strings.
     """
-    headers = {"Accept": "application/sparql-results+json", "User-Agent": user_agent}
+    headers = {
+        "Accept": "application/sparql-results+json",
+        "Content-Type": "application/x-www-form-urlencoded",
+        "User-Agent": user_agent,
+    }
+    # POST keeps large VALUES batches clear of URL length limits
     resp = http_request_with_retry(
-        "GET",
+        "POST",
         SPARQL_ENDPOINT,
-        params={"query": query},
+        data={"query": query},
         headers=headers,
         timeout=timeout,
     )
-    return resp.json()
+    return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+# Ontology Alignments (ECRM - CRM, LRMoo - FRBRoo/eFRBRoo) and property inverses
+ECRM_TO_CRM = [
+    # Classes
+    "E21_Person",
+    "E35_Title",
+    "E42_Identifier",
+    "E52_Time-Span",
+    "E53_Place",
+    "E55_Type",
+    "E73_Information_Object",
+    "E74_Group",
+]
+
+# Properties
+ECRM_PROPERTIES = [
+    ("P1_is_identified_by", "P1i_identifies"),
+    ("P2_has_type", "P2i_is_type_of"),
+    ("P4_has_time-span", "P4i_is_time-span_of"),
+    ("P7_took_place_at", "P7i_witnessed"),
+    ("P14_carried_out_by", "P14i_performed"),
+    ("P102_has_title", "P102i_is_title_of"),
+    ("P138_represents", "P138i_has_representation"),
+    ("P190_has_symbolic_content", "P190i_is_content_of")
+]
+
+LRMOO_TO_FRBROO = {
+    "F1_Work": "F1_Work",
+    "F2_Expression": "F2_Expression",
+    "F3_Manifestation": "F3_Manifestation_Product_Type",
+    "F5_Item": "F5_Item",
+    "F27_Work_Creation": "F27_Work_Conception",
+    "F28_Expression_Creation": "F28_Expression_Creation",
+    "F30_Manifestation_Creation": "F30_Publication_Event",
+    "F32_Item_Production_Event": "F32_Carrier_Production_Event"
+}
+
+LRMOO_PROPERTIES = [
+    ("R3_is_realised_in", "R3i_realises", "R3_is_realised_in", "R3i_realises"),
+    ("R4_embodies", "R4i_is_embodied_in", "R4i_comprises_carriers_of", "R4_carriers_provided_by"),
+    ("R7_exemplifies", "R7i_is_exemplified_by", "R7_is_example_of", "R7i_has_example"),
+    ("R16_created", "R16i_was_created_by", "R16_initiated", "R16i_was_initiated_by"),
+    ("R17_created", "R17i_was_created_by", "R17_created", "R17i_was_created_by"),
+    ("R19_created_a_realisation_of", "R19i_was_realised_through", "R19_created_a_realisation_of", "R19i_was_realised_through"),
+    ("R24_created", "R24i_was_created_through", "R24_created", "R24i_was_created_through"),
+    ("R27_materialized", "R27i_was_materialized_by", "R27_used_as_source_material", "R27i_was_used_by"),
+    ("R28_produced", "R28i_was_produced_by", "R28_produced", "R28i_was_produced_by"),
+]
+
+def _alignment_triples() -> List[Tuple[URIRef, URIRef, URIRef]]:
+    triples = []
+    for cls in ECRM_TO_CRM:
+        triples.append((ECRM.term(cls), OWL.equivalentClass, CRM.term(cls)))
+
+    for direct, inverse in ECRM_PROPERTIES:
+        triples.append((ECRM.term(direct), OWL.inverseOf, ECRM.term(inverse)))
+        triples.append((ECRM.term(direct), OWL.equivalentProperty, CRM.term(direct)))
+        triples.append((ECRM.term(inverse), OWL.inverseOf, ECRM.term(direct)))
+        triples.append((ECRM.term(inverse), OWL.equivalentProperty, CRM.term(inverse)))
+
+    for lr, fr in LRMOO_TO_FRBROO.items():
+        triples.append((LRMOO.term(lr), OWL.equivalentClass, FRBROO.term(fr)))
+        triples.append((LRMOO.term(lr), OWL.equivalentClass, EFRBROO.term(fr)))
+
+    for lr_direct, lr_inverse, fr_direct, fr_inverse in LRMOO_PROPERTIES:
+        triples.append((LRMOO.term(lr_direct), OWL.inverseOf, LRMOO.term(lr_inverse)))
+        triples.append((LRMOO.term(lr_inverse), OWL.inverseOf, LRMOO.term(lr_direct)))
+        triples.append((LRMOO.term(lr_direct), OWL.equivalentProperty, FRBROO.term(fr_direct)))
+        triples.append((LRMOO.term(lr_direct), OWL.equivalentProperty, EFRBROO.term(fr_direct)))
+        triples.append((LRMOO.term(lr_inverse), OWL.equivalentProperty, FRBROO.term(fr_inverse)))
+        triples.append((LRMOO.term(lr_inverse), OWL.equivalentProperty, EFRBROO.term(fr_inverse)))
+    return triples
+
+# Built once at import; create_graph() only copies them in
+ALIGNMENT_TRIPLES = tuple(_alignment_triples())
 
 # Graph construction
 def create_graph() -> Graph:
@@ -163,72 +287,7 @@ def create_graph() -> Graph:
     g.add((ontology_uri, OWL.imports, LRMOO_URI))
 
     # Ontology Alignments (ECRM - CRM, LRMoo - FRBRoo/eFRBRoo) and property inverses
-    ecrm_to_crm = [
-        # Classes
-        ("E21_Person",),
-        ("E35_Title",),
-        ("E42_Identifier",),
-        ("E52_Time-Span",),
-        ("E53_Place",),
-        ("E55_Type",),
-        ("E73_Information_Object",),
-        ("E74_Group",),
-    ]
-
-    for cls in ecrm_to_crm:
-        g.add((ECRM.term(cls[0]), OWL.equivalentClass, CRM.term(cls[0])))
-
-    # Properties
-    ecrm_properties = [
-        ("P1_is_identified_by", "P1i_identifies"),
-        ("P2_has_type", "P2i_is_type_of"),
-        ("P4_has_time-span", "P4i_is_time-span_of"),
-        ("P7_took_place_at", "P7i_witnessed"),
-        ("P14_carried_out_by", "P14i_performed"),
-        ("P102_has_title", "P102i_is_title_of"),
-        ("P138_represents", "P138i_has_representation"),
-        ("P190_has_symbolic_content", "P190i_is_content_of")
-    ]
-
-    for direct, inverse in ecrm_properties:
-        g.add((ECRM.term(direct), OWL.inverseOf, ECRM.term(inverse)))
-        g.add((ECRM.term(direct), OWL.equivalentProperty, CRM.term(direct)))
-        g.add((ECRM.term(inverse), OWL.inverseOf, ECRM.term(direct)))
-        g.add((ECRM.term(inverse), OWL.equivalentProperty, CRM.term(inverse)))
-
-    lrmoo_to_frbroo = {
-        "F1_Work": "F1_Work",
-        "F2_Expression": "F2_Expression",
-        "F3_Manifestation": "F3_Manifestation_Product_Type",
-        "F5_Item": "F5_Item",
-        "F27_Work_Creation": "F27_Work_Conception",
-        "F28_Expression_Creation": "F28_Expression_Creation",
-        "F30_Manifestation_Creation": "F30_Publication_Event",
-        "F32_Item_Production_Event": "F32_Carrier_Production_Event"
-    }
-    for lr, fr in lrmoo_to_frbroo.items():
-        g.add((LRMOO.term(lr), OWL.equivalentClass, FRBROO.term(fr)))
-        g.add((LRMOO.term(lr), OWL.equivalentClass, EFRBROO.term(fr)))
-
-    lrmoo_properties = [
-        ("R3_is_realised_in", "R3i_realises", "R3_is_realised_in", "R3i_realises"),
-        ("R4_embodies", "R4i_is_embodied_in", "R4i_comprises_carriers_of", "R4_carriers_provided_by"),
-        ("R7_exemplifies", "R7i_is_exemplified_by", "R7_is_example_of", "R7i_has_example"),
-        ("R16_created", "R16i_was_created_by", "R16_initiated", "R16i_was_initiated_by"),
-        ("R17_created", "R17i_was_created_by", "R17_created", "R17i_was_created_by"),
-        ("R19_created_a_realisation_of", "R19i_was_realised_through", "R19_created_a_realisation_of", "R19i_was_realised_through"),
-        ("R24_created", "R24i_was_created_through", "R24_created", "R24i_was_created_through"),
-        ("R27_materialized", "R27i_was_materialized_by", "R27_used_as_source_material", "R27i_was_used_by"),
-        ("R28_produced", "R28i_was_produced_by", "R28_produced", "R28i_was_produced_by"),
-    ]
-
-    for lr_direct, lr_inverse, fr_direct, fr_inverse in lrmoo_properties:
-        g.add((LRMOO.term(lr_direct), OWL.inverseOf, LRMOO.term(lr_inverse)))
-        g.add((LRMOO.term(lr_inverse), OWL.inverseOf, LRMOO.term(lr_direct)))
-        g.add((LRMOO.term(lr_direct), OWL.equivalentProperty, FRBROO.term(fr_direct)))
-        g.add((LRMOO.term(lr_direct), OWL.equivalentProperty, EFRBROO.term(fr_direct)))
-        g.add((LRMOO.term(lr_inverse), OWL.equivalentProperty, FRBROO.term(fr_inverse)))
-        g.add((LRMOO.term(lr_inverse), OWL.equivalentProperty, EFRBROO.term(fr_inverse)))
+    g.addN((s, p, o, g) for s, p, o in ALIGNMENT_TRIPLES)
 
     return g
 
@@ -245,6 +304,9 @@ def load_qids(path: Path) -> List[str]:
 def extract_year(date_str: str) -> Optional[str]:
     return date_str[:4] if date_str else None
 
+def qid_of(binding: Dict[str, str]) -> str:
+    return binding["value"].rpartition("/")[2]
+
 # SPARQL queries
 def query_wikidata(qids: List[str], max_retries: int = MAX_RETRIES):
     values = " ".join(f"wd:{qid}" for qid in qids)
@@ -282,29 +344,50 @@ def query_wikidata(qids: List[str], max_retries: int = MAX_RETRIES):
                 return []
             time.sleep(wait)
 
-def fetch_label(qid: str):
-    query = f"""
-    SELECT ?label_de ?label_en WHERE {{
-      wd:{qid} rdfs:label ?label_de . FILTER(LANG(?label_de) = "de")
-      OPTIONAL {{ wd:{qid} rdfs:label ?label_en . FILTER(LANG(?label_en) = "en") }}
-    }}
+def batch_fetch_labels(qids: Iterable[str]) -> Dict[str, Tuple[str, str]]:
     """
-    ua = "SapphoWorkIntegrationBot/1.0 (contact@example.com)"
-    try:
-        data = query_wikidata_raw(query, user_agent=ua, timeout=30)
-        results = data["results"]["bindings"]
-        if results:
-            label_de = results[0].get("label_de", {}).get("value")
-            label_en = results[0].get("label_en", {}).get("value")
-            if label_de:
-                return label_de, "de"
-            elif label_en:
-                return label_en, "en"
-    except Exception as e:
-        print(f"[WARN] Could not fetch label for {qid}: {e}")
-    return "Untitled", "en"
+    Fetch German (fallback: English) labels for many QIDs via wbgetentities,
+    50 ids per request. QIDs without either label are left out of the result.
+    """
+    qids = sorted(set(qids))
+    labels: Dict[str, Tuple[str, str]] = {}
+    for i in range(0, len(qids), LABEL_BATCH_SIZE):
+        chunk = qids[i:i+LABEL_BATCH_SIZE]
+        try:
+            resp = http_request_with_retry(
+                "GET",
+                WIKIDATA_API,
+                params={
+                    "action": "wbgetentities",
+                    "format": "json",
+                    "props": "labels",
+                    "languages": "de|en",
+                    "ids": "|".join(chunk),
+                },
+                timeout=30,
+            )
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
+            entities = data.get("entities", {})
+        except Exception as e:
+            print(f"[WARN] Could not fetch labels for {len(chunk)} QIDs: {e}")
+            continue
+        for qid, entity in entities.items():
+            entity_labels = entity.get("labels", {})
+            for lang in ("de", "en"):
+                if lang in entity_labels:
+                    labels[qid] = (entity_labels[lang]["value"], lang)
+                    break
+    return labels
 
 # Label helpers
+@lru_cache(maxsize=None)
+def lit_en(text: str) -> Literal:
+    """
+    English literal for a derived label such as "Work of ...".
+    Rows repeating a work share the same label strings, so the Literal is built once.
+    """
+    return Literal(text, lang="en")
+
 def label_for(title_de, title_en, work_label):
     if title_de:
         return title_de, "de"
@@ -315,35 +398,140 @@ def label_for(title_de, title_en, work_label):
     else:
         return "Untitled", "en"
 
-def manifestation_label_for(r):
+# Result fields holding linked entities, each with an optional '<field>Label' binding
+LINKED_FIELDS = ("genre", "author", "pub_place", "publisher", "editor", "publishedIn", "partOf")
+
+def unlabeled_qids(results) -> set:
+    """
+    QIDs of linked entities whose label is not part of the SPARQL result.
+    """
+    qids = set()
+    for r in results:
+        for field in LINKED_FIELDS:
+            if field in r and field + "Label" not in r:
+                qids.add(qid_of(r[field]))
+    return qids
+
+def linked_label(r, field: str, labels: Dict[str, Tuple[str, str]], default: str = "Unknown") -> str:
+    """
+    Label of the entity in 'field': from the SPARQL result, else from the prefetched labels.
+    """
+    if field + "Label" in r:
+        return r[field + "Label"]["value"]
+    qid = qid_of(r[field])
+    return labels[qid][0] if qid in labels else default
+
+def manifestation_label_for(r, labels: Dict[str, Tuple[str, str]]):
     if "publishedInLabel" in r:
         return r["publishedInLabel"]["value"], "de"
     elif "partOfLabel" in r:
         return r["partOfLabel"]["value"], "de"
     elif "publishedIn" in r:
-        parent_qid = r["publishedIn"]["value"].split("/")[-1]
-        return fetch_label(parent_qid)
+        parent_qid = qid_of(r["publishedIn"])
+        return labels.get(parent_qid, ("Untitled", "en"))
     elif "partOf" in r:
-        parent_qid = r["partOf"]["value"].split("/")[-1]
-        return fetch_label(parent_qid)
+        parent_qid = qid_of(r["partOf"])
+        return labels.get(parent_qid, ("Untitled", "en"))
     else:
         return None, None
 
+def fetch_batch(batch: List[str]):
+    """
+    Query one VALUES batch and prefetch the labels the result does not carry.
+    """
+    results = query_wikidata(batch)
+    # Missing labels of linked entities, one wbgetentities call per 50 QIDs
+    return results, batch_fetch_labels(unlabeled_qids(results))
+
+def fetch_batches(batches: List[List[str]], max_workers: int = MAX_WORKERS):
+    """
+    Yield (results, labels) per batch, in order, while the following
+    batches are already being fetched over the shared session.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(fetch_batch, batches)
+
 # Main processing
-def process(g: Graph, qids: List[str]) -> None:
+def process(g: Graph, qids: List[str], batch_size: int = BATCH_SIZE) -> None:
     # Caches for deduplication
     genre_cache: Dict[str, URIRef] = {}
     date_cache: Dict[str, URIRef] = {}
     publisher_cache: Dict[str, URIRef] = {}
     place_cache: Dict[str, URIRef] = {}
-
-    # Process in Batches of 20
-    for i in tqdm(range(0, len(qids), 20)):
-        batch = qids[i:i+20]
-        results = query_wikidata(batch)
+    author_cache: Dict[str, URIRef] = {}
+    editor_cache: Dict[str, URIRef] = {}
+
+    # Shared identifier type, described once rather than for every row
+    g.add((WIKIDATA_ID_TYPE, RDF.type, ECRM.E55_Type))
+    g.add((WIKIDATA_ID_TYPE, RDFS.label, WIKIDATA_ID_LABEL))
+    g.add((WIKIDATA_ID_TYPE, OWL.sameAs, WIKIDATA_ID_ITEM))
+
+    # Namespace attribute access builds a new URIRef on every call, so the
+    # terms emitted per row are resolved once here and used as locals
+    rdf_type = RDF.type
+    rdfs_label = RDFS.label
+    rdfs_seeAlso = RDFS.seeAlso
+    owl_sameAs = OWL.sameAs
+    prov_wasDerivedFrom = PROV.wasDerivedFrom
+    E21_Person = ECRM.E21_Person
+    P14_carried_out_by = ECRM.P14_carried_out_by
+    P14i_performed = ECRM.P14i_performed
+    P1_is_identified_by = ECRM.P1_is_identified_by
+    P1i_identifies = ECRM.P1i_identifies
+    E42_Identifier = ECRM.E42_Identifier
+    P2_has_type = ECRM.P2_has_type
+    P2i_is_type_of = ECRM.P2i_is_type_of
+    P102_has_title = ECRM.P102_has_title
+    P102i_is_title_of = ECRM.P102i_is_title_of
+    E35_Title = ECRM.E35_Title
+    P190i_is_content_of = ECRM.P190i_is_content_of
+    E55_Type = ECRM.E55_Type
+    P190_has_symbolic_content = ECRM.P190_has_symbolic_content
+    E74_Group = ECRM.E74_Group
+    E53_Place = ECRM.E53_Place
+    P7_took_place_at = ECRM.P7_took_place_at
+    P7i_witnessed = ECRM.P7i_witnessed
+    E73_Information_Object = ECRM.E73_Information_Object
+    P138_represents = ECRM.P138_represents
+    P138i_has_representation = ECRM.P138i_has_representation
+    F1_Work = LRMOO.F1_Work
+    R3_is_realised_in = LRMOO.R3_is_realised_in
+    R3i_realises = LRMOO.R3i_realises
+    F27_Work_Creation = LRMOO.F27_Work_Creation
+    R16_created = LRMOO.R16_created
+    R16i_was_created_by = LRMOO.R16i_was_created_by
+    F2_Expression = LRMOO.F2_Expression
+    F28_Expression_Creation = LRMOO.F28_Expression_Creation
+    R17_created = LRMOO.R17_created
+    R17i_was_created_by = LRMOO.R17i_was_created_by
+    R19_created_a_realisation_of = LRMOO.R19_created_a_realisation_of
+    R19i_was_realised_through = LRMOO.R19i_was_realised_through
+    F3_Manifestation = LRMOO.F3_Manifestation
+    R4_embodies = LRMOO.R4_embodies
+    R4i_is_embodied_in = LRMOO.R4i_is_embodied_in
+    F30_Manifestation_Creation = LRMOO.F30_Manifestation_Creation
+    R24_created = LRMOO.R24_created
+    R24i_was_created_through = LRMOO.R24i_was_created_through
+    F32_Item_Production_Event = LRMOO.F32_Item_Production_Event
+    R27_materialized = LRMOO.R27_materialized
+    R27i_was_materialized_by = LRMOO.R27i_was_materialized_by
+    R28_produced = LRMOO.R28_produced
+    R28i_was_produced_by = LRMOO.R28i_was_produced_by
+    F5_Item = LRMOO.F5_Item
+    R7_exemplifies = LRMOO.R7_exemplifies
+    R7i_is_exemplified_by = LRMOO.R7i_is_exemplified_by
+
+    # Triples of a whole batch go into the store with one addN
+    buf = []
+    add = buf.append
+
+    # Process in batches of BATCH_SIZE
+    batches = [qids[i:i+batch_size] for i in range(0, len(qids), batch_size)]
+    for results, labels in tqdm(fetch_batches(batches), total=len(batches), mininterval=2.0, smoothing=0):
         for r in results:
             # Triple Creation
-            qid = r["work"]["value"].split("/")[-1]
+            qid = qid_of(r["work"])
+            wd_uri = URIRef(f"{WD}{qid}")
             work_uri = URIRef(f"{SAPPHO_BASE_URI}work/{qid}")
             expression_uri = URIRef(f"{SAPPHO_BASE_URI}expression/{qid}")
             label, lang = label_for(
@@ -354,79 +542,79 @@ def process(g: Graph, qids: List[str]) -> None:
             title_uri = URIRef(f"{SAPPHO_BASE_URI}title/expression/{qid}")
             title_string_uri = URIRef(f"{SAPPHO_BASE_URI}title_string/expression/{qid}")
 
-            g.add((work_uri, RDF.type, LRMOO.F1_Work))
-            g.add((work_uri, RDFS.label, Literal(f"Work of {label}", lang="en")))
-            g.add((work_uri, LRMOO.R3_is_realised_in, expression_uri))
-            g.add((expression_uri, LRMOO.R3i_realises, work_uri))
+            add((work_uri, rdf_type, F1_Work))
+            add((work_uri, rdfs_label, lit_en(f"Work of {label}")))
+            add((work_uri, R3_is_realised_in, expression_uri))
+            add((expression_uri, R3i_realises, work_uri))
 
             # Work Creation
             work_creation_uri = URIRef(f"{SAPPHO_BASE_URI}work_creation/{qid}")
-            g.add((work_creation_uri, RDF.type, LRMOO.F27_Work_Creation))
-            g.add((work_creation_uri, RDFS.label, Literal(f"Work creation of {label}", lang="en")))
-            g.add((work_creation_uri, LRMOO.R16_created, work_uri))
-            g.add((work_uri, LRMOO.R16i_was_created_by, work_creation_uri))
-            g.add((work_creation_uri, PROV.wasDerivedFrom, URIRef(f"{WD}{qid}")))
+            add((work_creation_uri, rdf_type, F27_Work_Creation))
+            add((work_creation_uri, rdfs_label, lit_en(f"Work creation of {label}")))
+            add((work_creation_uri, R16_created, work_uri))
+            add((work_uri, R16i_was_created_by, work_creation_uri))
+            add((work_creation_uri, prov_wasDerivedFrom, wd_uri))
 
             if "author" in r:
-                author_qid = r["author"]["value"].split("/")[-1]
-                author_uri = URIRef(f"{SAPPHO_BASE_URI}person/{author_qid}")
-                g.add((work_creation_uri, ECRM.P14_carried_out_by, author_uri))
-                g.add((author_uri, ECRM.P14i_performed, work_creation_uri))
-                
-                g.add((author_uri, RDF.type, ECRM.E21_Person))
-                g.add((author_uri, RDFS.label, Literal(r.get("authorLabel", {}).get("value", "Unknown"))))
-                g.add((author_uri, OWL.sameAs, URIRef(r["author"]["value"])))
+                author_qid = qid_of(r["author"])
+                if author_qid not in author_cache:
+                    author_uri = URIRef(f"{SAPPHO_BASE_URI}person/{author_qid}")
+                    author_cache[author_qid] = author_uri
+                    add((author_uri, rdf_type, E21_Person))
+                    add((author_uri, rdfs_label, Literal(linked_label(r, "author", labels))))
+                    add((author_uri, owl_sameAs, URIRef(r["author"]["value"])))
+                author_uri = author_cache[author_qid]
+                add((work_creation_uri, P14_carried_out_by, author_uri))
+                add((author_uri, P14i_performed, work_creation_uri))
 
             # Expression
-            g.add((expression_uri, RDF.type, LRMOO.F2_Expression))
-            g.add((expression_uri, RDFS.label, Literal(f"Expression of {label}", lang="en")))                
+            add((expression_uri, rdf_type, F2_Expression))
+            add((expression_uri, rdfs_label, lit_en(f"Expression of {label}")))                
             identifier_uri = URIRef(f"{SAPPHO_BASE_URI}identifier/{qid}")
-            g.add((expression_uri, ECRM.P1_is_identified_by, identifier_uri))
-            g.add((identifier_uri, ECRM.P1i_identifies, expression_uri))
-            g.add((identifier_uri, RDF.type, ECRM.E42_Identifier))
-            g.add((identifier_uri, RDFS.label, Literal(qid)))
-            g.add((identifier_uri, ECRM.P2_has_type, URIRef("https://sappho-digital.com/id_type/wikidata")))
-            g.add((URIRef("https://sappho-digital.com/id_type/wikidata"), ECRM.P2i_is_type_of, identifier_uri))
+            add((expression_uri, P1_is_identified_by, identifier_uri))
+            add((identifier_uri, P1i_identifies, expression_uri))
+            add((identifier_uri, rdf_type, E42_Identifier))
+            add((identifier_uri, rdfs_label, Literal(qid)))
+            add((identifier_uri, P2_has_type, WIKIDATA_ID_TYPE))
+            add((WIKIDATA_ID_TYPE, P2i_is_type_of, identifier_uri))
             
-            wikidata_id_type_uri = URIRef("https://sappho-digital.com/id_type/wikidata")
-            g.add((wikidata_id_type_uri, RDF.type, ECRM.E55_Type))
-            g.add((wikidata_id_type_uri, RDFS.label, Literal("Wikidata ID", lang="en")))
-            g.add((wikidata_id_type_uri, OWL.sameAs, URIRef("http://www.wikidata.org/wiki/Q43649390")))
-            g.add((expression_uri, ECRM.P102_has_title, title_uri))
-            g.add((title_uri, ECRM.P102i_is_title_of, expression_uri))
-            g.add((title_uri, RDF.type, ECRM.E35_Title))
-            g.add((title_uri, ECRM.P190i_is_content_of, title_uri))
+            add((expression_uri, P102_has_title, title_uri))
+            add((title_uri, P102i_is_title_of, expression_uri))
+            add((title_uri, rdf_type, E35_Title))
+            add((title_uri, P190i_is_content_of, title_uri))
 
             if "genre" in r:
-                genre_qid = r["genre"]["value"].split("/")[-1]
+                genre_qid = qid_of(r["genre"])
                 if genre_qid not in genre_cache:
+                    if not genre_cache:
+                        # Shared genre type, described with the first genre
+                        add((GENRE_TYPE, rdf_type, E55_Type))
+                        add((GENRE_TYPE, rdfs_label, GENRE_TYPE_LABEL))
                     genre_uri = URIRef(f"{SAPPHO_BASE_URI}genre/{genre_qid}")
                     genre_cache[genre_qid] = genre_uri
-                    g.add((genre_uri, RDF.type, ECRM.E55_Type))
-                    g.add((genre_uri, RDFS.label, Literal(r.get("genreLabel", {}).get("value", "Unknown"), lang="en")))
-                    g.add((genre_uri, OWL.sameAs, URIRef(r["genre"]["value"])))
-                    g.add((genre_uri, ECRM.P2_has_type, URIRef(f"{SAPPHO_BASE_URI}genre_type/wikidata")))
-                    g.add((URIRef(f"{SAPPHO_BASE_URI}genre_type/wikidata"), ECRM.P2i_is_type_of, genre_uri))
-                    g.add((URIRef(f"{SAPPHO_BASE_URI}genre_type/wikidata"), RDF.type, ECRM.E55_Type))
-                    g.add((URIRef(f"{SAPPHO_BASE_URI}genre_type/wikidata"), RDFS.label, Literal("Wikidata Genre", lang="en")))
-                g.add((expression_uri, ECRM.P2_has_type, genre_cache[genre_qid]))
-                g.add((genre_cache[genre_qid], ECRM.P2i_is_type_of, expression_uri))
-
-            g.add((expression_uri, OWL.sameAs, URIRef(f"{WD}{qid}")))
-            g.add((expression_uri, PROV.wasDerivedFrom, URIRef(f"{WD}{qid}")))
+                    add((genre_uri, rdf_type, E55_Type))
+                    add((genre_uri, rdfs_label, Literal(linked_label(r, "genre", labels), lang="en")))
+                    add((genre_uri, owl_sameAs, URIRef(r["genre"]["value"])))
+                    add((genre_uri, P2_has_type, GENRE_TYPE))
+                    add((GENRE_TYPE, P2i_is_type_of, genre_uri))
+                add((expression_uri, P2_has_type, genre_cache[genre_qid]))
+                add((genre_cache[genre_qid], P2i_is_type_of, expression_uri))
+
+            add((expression_uri, owl_sameAs, wd_uri))
+            add((expression_uri, prov_wasDerivedFrom, wd_uri))
 
             # Expression Creation
             expression_creation_uri = URIRef(f"{SAPPHO_BASE_URI}expression_creation/{qid}")
-            g.add((expression_creation_uri, RDF.type, LRMOO.F28_Expression_Creation))
-            g.add((expression_creation_uri, RDFS.label, Literal(f"Expression creation of {label}", lang="en")))
-            g.add((expression_creation_uri, LRMOO.R17_created, expression_uri))
-            g.add((expression_uri, LRMOO.R17i_was_created_by, expression_creation_uri))
-            g.add((expression_creation_uri, LRMOO.R19_created_a_realisation_of, work_uri))
-            g.add((work_uri, LRMOO.R19i_was_realised_through, expression_creation_uri))
-            g.add((expression_creation_uri, PROV.wasDerivedFrom, URIRef(f"{WD}{qid}")))
+            add((expression_creation_uri, rdf_type, F28_Expression_Creation))
+            add((expression_creation_uri, rdfs_label, lit_en(f"Expression creation of {label}")))
+            add((expression_creation_uri, R17_created, expression_uri))
+            add((expression_uri, R17i_was_created_by, expression_creation_uri))
+            add((expression_creation_uri, R19_created_a_realisation_of, work_uri))
+            add((work_uri, R19i_was_realised_through, expression_creation_uri))
+            add((expression_creation_uri, prov_wasDerivedFrom, wd_uri))
 
             if "author" in r:
-                g.add((expression_creation_uri, ECRM.P14_carried_out_by, author_uri))
+                add((expression_creation_uri, P14_carried_out_by, author_uri))
 
             if "creation_date" in r:
                 year = extract_year(r["creation_date"]["value"])
@@ -434,60 +622,53 @@ def process(g: Graph, qids: List[str]) -> None:
                     if year not in date_cache:
                         date_uri = URIRef(f"{SAPPHO_BASE_URI}timespan/{year}")
                         date_cache[year] = date_uri
-                        g.add((date_uri, RDF.type, ECRM["E52_Time-Span"]))
-                        g.add((date_uri, RDFS.label, Literal(year, datatype=XSD.gYear)))
-                    g.add((expression_creation_uri, ECRM["P4_has_time-span"], date_cache[year]))
-                    g.add((date_cache[year], ECRM["P4i_is_time-span_of"], expression_creation_uri))
+                        add((date_uri, rdf_type, ECRM_E52))
+                        add((date_uri, rdfs_label, Literal(year, datatype=XSD.gYear)))
+                    add((expression_creation_uri, ECRM_P4, date_cache[year]))
+                    add((date_cache[year], ECRM_P4I, expression_creation_uri))
 
             # Manifestation
             manifestation_uri = URIRef(f"{SAPPHO_BASE_URI}manifestation/{qid}")
-            g.add((manifestation_uri, RDF.type, LRMOO.F3_Manifestation))
-            g.add((manifestation_uri, RDFS.label, Literal(f"Manifestation of {label}", lang="en")))
-            g.add((manifestation_uri, LRMOO.R4_embodies, expression_uri))
-            g.add((expression_uri, LRMOO.R4i_is_embodied_in, manifestation_uri))
+            add((manifestation_uri, rdf_type, F3_Manifestation))
+            add((manifestation_uri, rdfs_label, lit_en(f"Manifestation of {label}")))
+            add((manifestation_uri, R4_embodies, expression_uri))
+            add((expression_uri, R4i_is_embodied_in, manifestation_uri))
             
             manifestation_title_uri = URIRef(f"{SAPPHO_BASE_URI}title/manifestation/{qid}")
             manifestation_title_string_uri = URIRef(f"{SAPPHO_BASE_URI}title_string/manifestation/{qid}")
             
-            manifestation_label, manifestation_lang = manifestation_label_for(r)
+            manifestation_label, manifestation_lang = manifestation_label_for(r, labels)
             if manifestation_label is None:
                 manifestation_label = label
                 manifestation_lang = lang
-            
-            if "publishedIn" in r:
-                parent_qid = r["publishedIn"]["value"].split("/")[-1]
-                manifestation_label, manifestation_lang = fetch_label(parent_qid)
-            elif "partOf" in r:
-                parent_qid = r["partOf"]["value"].split("/")[-1]
-                manifestation_label, manifestation_lang = fetch_label(parent_qid)
-
-            g.add((manifestation_uri, ECRM.P102_has_title, manifestation_title_uri))
-            g.add((manifestation_title_uri, ECRM.P102i_is_title_of, manifestation_uri))
-            g.add((manifestation_title_uri, RDF.type, ECRM.E35_Title))
-            g.add((manifestation_title_uri, ECRM.P190_has_symbolic_content, manifestation_title_string_uri))
-            g.add((manifestation_title_uri, RDFS.label, Literal(manifestation_label, lang=manifestation_lang)))
+
+            add((manifestation_uri, P102_has_title, manifestation_title_uri))
+            add((manifestation_title_uri, P102i_is_title_of, manifestation_uri))
+            add((manifestation_title_uri, rdf_type, E35_Title))
+            add((manifestation_title_uri, P190_has_symbolic_content, manifestation_title_string_uri))
+            add((manifestation_title_uri, rdfs_label, Literal(manifestation_label, lang=manifestation_lang)))
 
             # Manifestation Creation
             manifestation_creation_uri = URIRef(f"{SAPPHO_BASE_URI}manifestation_creation/{qid}")
-            g.add((manifestation_creation_uri, RDF.type, LRMOO.F30_Manifestation_Creation))
-            g.add((manifestation_creation_uri, RDFS.label, Literal(f"Manifestation creation of {label}", lang="en")))
-            g.add((manifestation_creation_uri, LRMOO.R24_created, manifestation_uri))
-            g.add((manifestation_uri, LRMOO.R24i_was_created_through, manifestation_creation_uri))
-            g.add((manifestation_creation_uri, PROV.wasDerivedFrom, URIRef(f"{WD}{qid}")))
+            add((manifestation_creation_uri, rdf_type, F30_Manifestation_Creation))
+            add((manifestation_creation_uri, rdfs_label, lit_en(f"Manifestation creation of {label}")))
+            add((manifestation_creation_uri, R24_created, manifestation_uri))
+            add((manifestation_uri, R24i_was_created_through, manifestation_creation_uri))
+            add((manifestation_creation_uri, prov_wasDerivedFrom, wd_uri))
             if "author" in r:
-                g.add((manifestation_creation_uri, ECRM.P14_carried_out_by, author_uri))
-                g.add((author_uri, ECRM.P14i_performed, manifestation_creation_uri))
+                add((manifestation_creation_uri, P14_carried_out_by, author_uri))
+                add((author_uri, P14i_performed, manifestation_creation_uri))
 
             if "publisher" in r:
-                publisher_qid = r["publisher"]["value"].split("/")[-1]
+                publisher_qid = qid_of(r["publisher"])
                 if publisher_qid not in publisher_cache:
                     publisher_uri = URIRef(f"{SAPPHO_BASE_URI}publisher/{publisher_qid}")
                     publisher_cache[publisher_qid] = publisher_uri
-                    g.add((publisher_uri, RDF.type, ECRM.E74_Group))
-                    g.add((publisher_uri, RDFS.label, Literal(r.get("publisherLabel", {}).get("value", "Unknown"), lang="en")))
-                    g.add((publisher_uri, OWL.sameAs, URIRef(r["publisher"]["value"])))
-                g.add((manifestation_creation_uri, ECRM.P14_carried_out_by, publisher_cache[publisher_qid]))
-                g.add((publisher_cache[publisher_qid], ECRM.P14i_performed, manifestation_creation_uri))
+                    add((publisher_uri, rdf_type, E74_Group))
+                    add((publisher_uri, rdfs_label, Literal(linked_label(r, "publisher", labels), lang="en")))
+                    add((publisher_uri, owl_sameAs, URIRef(r["publisher"]["value"])))
+                add((manifestation_creation_uri, P14_carried_out_by, publisher_cache[publisher_qid]))
+                add((publisher_cache[publisher_qid], P14i_performed, manifestation_creation_uri))
 
             if "pub_date" in r:
                 pub_year = extract_year(r["pub_date"]["value"])
@@ -495,78 +676,92 @@ def process(g: Graph, qids: List[str]) -> None:
                     if pub_year not in date_cache:
                         pub_date_uri = URIRef(f"{SAPPHO_BASE_URI}timespan/{pub_year}")
                         date_cache[pub_year] = pub_date_uri
-                        g.add((pub_date_uri, RDF.type, ECRM["E52_Time-Span"]))
-                        g.add((pub_date_uri, RDFS.label, Literal(pub_year, datatype=XSD.gYear)))
-                    g.add((manifestation_creation_uri, ECRM["P4_has_time-span"], date_cache[pub_year]))
-                    g.add((date_cache[pub_year], ECRM["P4i_is_time-span_of"], manifestation_creation_uri))
+                        add((pub_date_uri, rdf_type, ECRM_E52))
+                        add((pub_date_uri, rdfs_label, Literal(pub_year, datatype=XSD.gYear)))
+                    add((manifestation_creation_uri, ECRM_P4, date_cache[pub_year]))
+                    add((date_cache[pub_year], ECRM_P4I, manifestation_creation_uri))
 
             if "pub_place" in r:
-                place_qid = r["pub_place"]["value"].split("/")[-1]
+                place_qid = qid_of(r["pub_place"])
                 if place_qid not in place_cache:
                     place_uri = URIRef(f"{SAPPHO_BASE_URI}place/{place_qid}")
                     place_cache[place_qid] = place_uri
-                    g.add((place_uri, RDF.type, ECRM.E53_Place))
-                    g.add((place_uri, RDFS.label, Literal(r.get("pub_placeLabel", {}).get("value", "Unknown"), lang="en")))
-                    g.add((place_uri, OWL.sameAs, URIRef(r["pub_place"]["value"])))
-                g.add((manifestation_creation_uri, ECRM.P7_took_place_at, place_cache[place_qid]))
-                g.add((place_cache[place_qid], ECRM.P7i_witnessed, manifestation_creation_uri))
+                    add((place_uri, rdf_type, E53_Place))
+                    add((place_uri, rdfs_label, Literal(linked_label(r, "pub_place", labels), lang="en")))
+                    add((place_uri, owl_sameAs, URIRef(r["pub_place"]["value"])))
+                add((manifestation_creation_uri, P7_took_place_at, place_cache[place_qid]))
+                add((place_cache[place_qid], P7i_witnessed, manifestation_creation_uri))
 
             if "editor" in r:
-                editor_qid = r["editor"]["value"].split("/")[-1]
-                editor_uri = URIRef(f"{SAPPHO_BASE_URI}editor/{editor_qid}")
-                g.add((editor_uri, RDF.type, ECRM.E21_Person))
-                g.add((editor_uri, RDFS.label, Literal(r.get("editorLabel", {}).get("value", "Unknown"))))
-                g.add((editor_uri, OWL.sameAs, URIRef(r["editor"]["value"])))
-
-                id_uri = URIRef(f"{SAPPHO_BASE_URI}identifier/{editor_qid}")
-                g.add((editor_uri, ECRM.P1_is_identified_by, id_uri))
-                g.add((id_uri, ECRM.P1i_identifies, editor_uri))
-                g.add((id_uri, RDF.type, ECRM.E42_Identifier))
-                g.add((id_uri, RDFS.label, Literal(editor_qid)))
-                g.add((id_uri, ECRM.P2_has_type, URIRef("https://sappho-digital.com/id_type/wikidata")))
-                g.add((URIRef("https://sappho-digital.com/id_type/wikidata"), ECRM.P2i_is_type_of, id_uri))
-                g.add((manifestation_creation_uri, ECRM.P14_carried_out_by, editor_uri))
-                g.add((editor_uri, ECRM.P14i_performed, manifestation_creation_uri))
+                editor_qid = qid_of(r["editor"])
+                if editor_qid not in editor_cache:
+                    editor_uri = URIRef(f"{SAPPHO_BASE_URI}editor/{editor_qid}")
+                    editor_cache[editor_qid] = editor_uri
+                    add((editor_uri, rdf_type, E21_Person))
+                    add((editor_uri, rdfs_label, Literal(linked_label(r, "editor", labels))))
+                    add((editor_uri, owl_sameAs, URIRef(r["editor"]["value"])))
+
+                    id_uri = URIRef(f"{SAPPHO_BASE_URI}identifier/{editor_qid}")
+                    add((editor_uri, P1_is_identified_by, id_uri))
+                    add((id_uri, P1i_identifies, editor_uri))
+                    add((id_uri, rdf_type, E42_Identifier))
+                    add((id_uri, rdfs_label, Literal(editor_qid)))
+                    add((id_uri, P2_has_type, WIKIDATA_ID_TYPE))
+                    add((WIKIDATA_ID_TYPE, P2i_is_type_of, id_uri))
+                editor_uri = editor_cache[editor_qid]
+                add((manifestation_creation_uri, P14_carried_out_by, editor_uri))
+                add((editor_uri, P14i_performed, manifestation_creation_uri))
 
             item_production_uri = URIRef(f"{SAPPHO_BASE_URI}item_production/{qid}")
             item_uri = URIRef(f"{SAPPHO_BASE_URI}item/{qid}")
 
-            g.add((item_production_uri, RDF.type, LRMOO.F32_Item_Production_Event))
-            g.add((item_production_uri, RDFS.label, Literal(f"Item production event of {label}", lang="en")))
-            g.add((item_production_uri, LRMOO.R27_materialized, manifestation_uri))
-            g.add((manifestation_uri, LRMOO.R27i_was_materialized_by, item_production_uri))
-            g.add((item_production_uri, LRMOO.R28_produced, item_uri))
-            g.add((item_uri, LRMOO.R28i_was_produced_by, item_production_uri))
+            add((item_production_uri, rdf_type, F32_Item_Production_Event))
+            add((item_production_uri, rdfs_label, lit_en(f"Item production event of {label}")))
+            add((item_production_uri, R27_materialized, manifestation_uri))
+            add((manifestation_uri, R27i_was_materialized_by, item_production_uri))
+            add((item_production_uri, R28_produced, item_uri))
+            add((item_uri, R28i_was_produced_by, item_production_uri))
 
-            g.add((item_uri, RDF.type, LRMOO.F5_Item))
-            g.add((item_uri, RDFS.label, Literal(f"Item of {label}", lang="en")))
-            g.add((item_uri, LRMOO.R7_exemplifies, manifestation_uri))
-            g.add((manifestation_uri, LRMOO.R7i_is_exemplified_by, item_uri))
+            add((item_uri, rdf_type, F5_Item))
+            add((item_uri, rdfs_label, lit_en(f"Item of {label}")))
+            add((item_uri, R7_exemplifies, manifestation_uri))
+            add((manifestation_uri, R7i_is_exemplified_by, item_uri))
 
             if "digitalCopy" in r:
                 digital_uri = URIRef(f"{SAPPHO_BASE_URI}digital/{qid}")
-                g.add((digital_uri, RDF.type, ECRM.E73_Information_Object))
-                g.add((digital_uri, RDFS.label, Literal(f"Digital copy of {label}", lang="en")))
-                g.add((digital_uri, ECRM.P138_represents, expression_uri))
-                g.add((expression_uri, ECRM.P138i_has_representation, digital_uri))
-                g.add((digital_uri, RDFS.seeAlso, URIRef(r["digitalCopy"]["value"])))
+                add((digital_uri, rdf_type, E73_Information_Object))
+                add((digital_uri, rdfs_label, lit_en(f"Digital copy of {label}")))
+                add((digital_uri, P138_represents, expression_uri))
+                add((expression_uri, P138i_has_representation, digital_uri))
+                add((digital_uri, rdfs_seeAlso, URIRef(r["digitalCopy"]["value"])))
+
+        g.addN((s, p, o, g) for s, p, o in buf)
+        buf.clear()
 
 def parse_args(argv=None) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Retrieve bibliographic data from Wikidata and emit LRMoo/FRBRoo + CIDOC CRM TTL"
     )
     p.add_argument("--input",  type=Path, help="CSV with QIDs (e.g. examples/inputs/work-qids.csv)")
-    p.add_argument("--output", type=Path, help="Output Turtle (e.g. examples/outputs/works.ttl)")
+    p.add_argument("--output", type=Path, help="Output file (e.g. examples/outputs/works.ttl)")
+    p.add_argument("--format", choices=("turtle", "nt"), default="turtle",
+                   help="Output format (default: turtle); nt skips the Turtle pretty-printer and is much faster on large graphs")
     p.add_argument(
         "--shapes",
         type=Path,
         default=resources.shapes_path("work-shapes.ttl"),
         help="Path to SHACL shapes (default: package-installed work-shapes.ttl)",
     )
+    p.add_argument(
+        "--cache",
+        type=Path,
+        help="SQLite file for caching Wikidata responses across runs (requires requests-cache)",
+    )
     p.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
     return p.parse_args(argv)
 
 def main(argv=None) -> int:
+    global SESSION
     args = parse_args(argv)
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
                         format="%(levelname)s:%(name)s:%(message)s")
@@ -580,10 +775,16 @@ def main(argv=None) -> int:
 
     if args.output is None:
         repo_outdir = Path("examples/outputs")
-        args.output = (repo_outdir / "works.ttl") if repo_outdir.exists() else Path("works.ttl")
+        name = "works.nt" if args.format == "nt" else "works.ttl"
+        args.output = (repo_outdir / name) if repo_outdir.exists() else Path(name)
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
+    if args.cache is not None:
+        if requests_cache is None:
+            raise SystemExit('--cache requires requests-cache (pip install "wiki2crm[cache]")')
+        SESSION = make_session(args.cache)
+
     # Create graph
     g = create_graph()
 
@@ -593,8 +794,13 @@ def main(argv=None) -> int:
     # Process and enrich graph
     process(g, all_qids)
 
-    # Serialize to Turtle
-    g.serialize(destination=str(args.output), format="turtle")
+    # Serialize
+    if args.format == "nt":
+        fmt = "ox-nt" if oxrdflib is not None else "nt"
+    else:
+        fmt = "turtle"
+    with open(args.output, "wb", buffering=OUTPUT_BUFFER) as f:
+        g.serialize(destination=f, format=fmt, encoding="utf-8")
     print(f"✅ RDF graph written to {args.output}")
 
     # Validate the output graph using pySHACL